@@ -47,4 +47,4 @@ if __name__ == "__main__":
     from src.cli import main
     
     # Run the CLI
-    main() 
\ No newline at end of file
+    sys.exit(main())
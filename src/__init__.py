@@ -2,11 +2,24 @@
 Bayesian Partial Order Inference package.
 """
 
-__version__ = "0.1.0"
+import importlib
 
-from . import data
-from . import utils
-from . import inference
-from . import visualization
+__version__ = "0.1.0"
 
 __all__ = ['data', 'utils', 'inference', 'visualization']
+
+# Submodules are imported on first attribute access (PEP 562), so that e.g.
+# data generation does not pay for importing matplotlib/seaborn.
+_SUBMODULES = set(__all__)
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
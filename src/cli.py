@@ -8,140 +8,21 @@ different parameters without editing config files.
 import os
 import sys
 import argparse
-import json
-import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
+from functools import lru_cache
 
-from src.data.data_generator import generate_data
-from src.inference.po_inference import run_inference, save_results, generate_plots
-from src.utils.basic_utils import load_config
-from main import main as run_pipeline
+from src.cli_args import build_parser
 
 
+@lru_cache(maxsize=None)
 def get_project_root() -> Path:
     """Get the absolute path to the project root directory."""
     return Path(__file__).parent.parent.absolute()
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv=None) -> argparse.Namespace:
     """Parse command-line arguments."""
-    parser = argparse.ArgumentParser(
-        description='Run partial order inference pipeline',
-        formatter_class=argparse.ArgumentDefaultsHelpFormatter
-    )
-    
-    # Configuration files
-    parser.add_argument(
-        '--data-gen-config',
-        default='config/data_generator_config.yaml',
-        help='Path to data generator configuration file'
-    )
-    parser.add_argument(
-        '--mcmc-config',
-        default='config/mcmc_config.yaml',
-        help='Path to MCMC configuration file'
-    )
-    
-    # Data generation parameters
-    parser.add_argument(
-        '--n-items',
-        type=int,
-        help='Number of items to generate (overrides config)'
-    )
-    parser.add_argument(
-        '--n-observations',
-        type=int,
-        help='Number of observations to generate (overrides config)'
-    )
-    parser.add_argument(
-        '--dimension',
-        type=int,
-        help='Latent dimension K (overrides config)'
-    )
-    
-    # MCMC parameters
-    parser.add_argument(
-        '--iterations',
-        type=int,
-        help='Number of MCMC iterations (overrides config)'
-    )
-    parser.add_argument(
-        '--burn-in',
-        type=int,
-        help='Number of burn-in iterations (overrides config)'
-    )
-    parser.add_argument(
-        '--thinning',
-        type=int,
-        help='Thinning interval (overrides config)'
-    )
-    
-    # Output options
-    parser.add_argument(
-        '--output-dir',
-        default='output',
-        help='Output directory for results'
-    )
-    parser.add_argument(
-        '--data-name',
-        default='synthetic_data',
-        help='Name for the generated/loaded data'
-    )
-    
-    # Logging options
-    parser.add_argument(
-        '--verbose',
-        '-v',
-        action='store_true',
-        help='Enable verbose output'
-    )
-    parser.add_argument(
-        '--debug',
-        action='store_true',
-        help='Enable debug logging'
-    )
-    
-    # Other options
-    parser.add_argument(
-        '--generate-data',
-        action='store_true',
-        help='Force data generation even if data exists'
-    )
-    parser.add_argument(
-        '--no-generate-data',
-        action='store_true',
-        help='Skip data generation and use existing data'
-    )
-    
-    return parser.parse_args()
-
-
-def update_config(config: Dict[str, Any], args: argparse.Namespace) -> Dict[str, Any]:
-    """Update configuration with command line arguments."""
-    if args.n_items is not None:
-        config['generation']['n'] = args.n_items
-    if args.n_observations is not None:
-        config['generation']['N'] = args.n_observations
-    if args.dimension is not None:
-        config['generation']['K'] = args.dimension
-    
-    if args.iterations is not None:
-        config['mcmc']['num_iterations'] = args.iterations
-    if args.burn_in is not None:
-        config['visualization']['burn_in'] = args.burn_in
-    if args.thinning is not None:
-        config['mcmc']['thinning'] = args.thinning
-    
-    if args.output_dir is not None:
-        config['data']['output_dir'] = args.output_dir
-    
-    if args.generate_data:
-        config['data']['generate_data'] = True
-    if args.no_generate_data:
-        config['data']['generate_data'] = False
-    
-    return config
+    return build_parser().parse_args(argv)
 
 
 def setup_logging(verbose: bool, debug: bool) -> None:
@@ -168,6 +49,8 @@ def validate_data_file(data_file: str, project_root: Path) -> None:
     data_path = project_root / data_file
     if not data_path.exists():
         raise FileNotFoundError(f"Data file not found at: {data_path}")
+    import json
+    
     try:
         with open(data_path, 'r') as f:
             json.load(f)
@@ -177,6 +60,8 @@ def validate_data_file(data_file: str, project_root: Path) -> None:
 
 def setup_directories(output_dir: str):
     """Create necessary output directories."""
+    from src.utils.basic_utils import ensure_dir
+    
     dirs = {
         'figures': os.path.join(output_dir, 'figures'),
         'mcmc_traces': os.path.join(output_dir, 'figures', 'mcmc_traces'),
@@ -188,16 +73,53 @@ def setup_directories(output_dir: str):
     }
     
     for dir_path in dirs.values():
-        os.makedirs(dir_path, exist_ok=True)
+        ensure_dir(dir_path)
     
     return dirs
 
 
-def main() -> None:
+def warmup() -> None:
+    """Compile and cache the numba kernels so later runs skip JIT compilation."""
+    from src.utils.basic_utils import warmup_jit
+    
+    if warmup_jit():
+        print("Numba kernels compiled and cached.")
+    else:
+        print("Numba is not installed; nothing to compile.")
+
+
+def compile_configs() -> None:
+    """Write the JSON copies of the project's YAML configs read by load_config."""
+    from src.utils.basic_utils import compile_configs as _compile_configs
+    
+    config_dir = get_project_root() / 'config'
+    for path in _compile_configs(str(config_dir)):
+        print(f"Wrote {path}")
+
+
+def main(argv=None) -> int:
     """Main CLI function."""
+    # --version needs neither the option set nor any of the heavy imports
+    if '--version' in (sys.argv[1:] if argv is None else argv):
+        from src import __version__
+        print(f"po_inference {__version__}")
+        return 0
+    
+    args = parse_args(argv)
+    
+    if args.warmup:
+        warmup()
+        return 0
+    
+    if args.compile_configs:
+        compile_configs()
+        return 0
+    
     try:
-        # Parse arguments
-        args = parse_args()
+        # Heavy imports (numpy, yaml, matplotlib, the MCMC stack) are deferred
+        # until after argument parsing, so --help and usage errors return fast
+        from src.utils.basic_utils import load_config
+        from src.pipeline import run_pipeline, update_config_with_args
         
         # Get project root directory
         project_root = get_project_root()
@@ -205,21 +127,41 @@ def main() -> None:
         # Set up logging
         setup_logging(args.verbose, args.debug)
         
-        # Load configurations
-        data_gen_config = load_config(args.data_gen_config)
-        mcmc_config = load_config(args.mcmc_config)
+        # Load configurations; without a data generator config, the MCMC
+        # config's generation section is used
+        mcmc_config_path = project_root / args.mcmc_config
+        if not mcmc_config_path.exists():
+            raise FileNotFoundError(f"MCMC config not found at: {mcmc_config_path}")
+        mcmc_config = update_config_with_args(load_config(str(mcmc_config_path)), args)
         
-        # Update configurations with command line arguments
-        data_gen_config = update_config(data_gen_config, args)
-        mcmc_config = update_config(mcmc_config, args)
+        data_gen_config = None
+        if args.data_config is not None:
+            data_gen_config_path = project_root / args.data_config
+            if not data_gen_config_path.exists():
+                raise FileNotFoundError(f"Data generator config not found at: {data_gen_config_path}")
+            data_gen_config = update_config_with_args(load_config(str(data_gen_config_path)), args)
         
         # Run pipeline
-        run_pipeline(data_gen_config, mcmc_config, args.data_name)
+        run_pipeline(
+            mcmc_config,
+            str(project_root),
+            data_gen_config,
+            args.data_name,
+            generate_only=args.generate_data_only,
+            inference_only=args.inference_only,
+            plot_only=args.plot_only,
+            num_chains=args.num_chains,
+            num_workers=args.num_workers,
+            plots=args.plots,
+            pretty=args.pretty
+        )
         
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
-        sys.exit(1)
+        return 1
+    
+    return 0
 
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(main())
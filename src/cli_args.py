@@ -0,0 +1,200 @@
+"""
+Command-line argument definitions shared by all entry points.
+"""
+
+import argparse
+
+from src import __version__
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be at least 1."""
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser for the partial order inference pipeline."""
+    parser = argparse.ArgumentParser(
+        description='Run partial order inference pipeline',
+        formatter_class=argparse.ArgumentDefaultsHelpFormatter
+    )
+    parser.add_argument(
+        '--version',
+        action='version',
+        version=f'po_inference {__version__}'
+    )
+
+    # Configuration files
+    parser.add_argument(
+        '--mcmc-config',
+        default='config/mcmc_config.yaml',
+        help='Path to MCMC configuration file (relative to the project root)'
+    )
+    parser.add_argument(
+        '--data-config',
+        '--data-gen-config',
+        dest='data_config',
+        default=None,
+        help='Path to data generator configuration file (defaults to the MCMC configuration)'
+    )
+    parser.add_argument(
+        '--data-file',
+        default=None,
+        help='Existing data file to use (overrides data.path in the config)'
+    )
+
+    # Operation modes
+    parser.add_argument(
+        '--generate-data',
+        action='store_true',
+        help='Force data generation even if data exists'
+    )
+    parser.add_argument(
+        '--no-generate-data',
+        action='store_true',
+        help='Skip data generation and use existing data'
+    )
+    parser.add_argument(
+        '--generate-data-only',
+        action='store_true',
+        help='Generate synthetic data only'
+    )
+    parser.add_argument(
+        '--inference-only',
+        action='store_true',
+        help='Run inference only with existing data'
+    )
+    parser.add_argument(
+        '--plot-only',
+        action='store_true',
+        help='Generate plots only from existing data and results'
+    )
+    parser.add_argument(
+        '--no-plots',
+        dest='plots',
+        action='store_false',
+        help='Skip plot generation after inference and only save results'
+    )
+    parser.add_argument(
+        '--warmup',
+        action='store_true',
+        help='Compile and cache the numba kernels, then exit'
+    )
+    parser.add_argument(
+        '--compile-configs',
+        action='store_true',
+        help='Write JSON copies of config/*.yaml for faster loading, then exit'
+    )
+
+    # Data generation parameters
+    parser.add_argument(
+        '--n-items',
+        type=int,
+        help='Number of items to generate (overrides config)'
+    )
+    parser.add_argument(
+        '--n-observations',
+        type=int,
+        help='Number of observations to generate (overrides config)'
+    )
+
+    # MCMC parameters
+    parser.add_argument(
+        '--iterations',
+        type=int,
+        help='Number of MCMC iterations (overrides config)'
+    )
+    parser.add_argument(
+        '--burn-in',
+        type=int,
+        help='Number of burn-in iterations (overrides config)'
+    )
+    parser.add_argument(
+        '--thinning',
+        type=int,
+        help='Thinning interval (overrides config)'
+    )
+    parser.add_argument(
+        '--dimension',
+        '--dimensions',
+        '--latent-dim',
+        dest='dimension',
+        type=int,
+        help='Latent dimension K (overrides config)'
+    )
+    parser.add_argument(
+        '--seed',
+        type=int,
+        help='Random seed for data generation and MCMC (overrides random_seed in config)'
+    )
+    parser.add_argument(
+        '--num-chains',
+        type=_positive_int,
+        default=1,
+        help='Number of independent MCMC chains'
+    )
+    parser.add_argument(
+        '--num-workers',
+        type=_positive_int,
+        default=None,
+        help='Number of worker processes for the chains (default: one per chain)'
+    )
+
+    # Model parameters
+    parser.add_argument(
+        '--noise-model',
+        choices=['queue_jump', 'mallows_noise'],
+        help='Noise model to use (overrides config)'
+    )
+
+    # Prior parameters
+    parser.add_argument(
+        '--rho-prior',
+        type=float,
+        help='Prior parameter for correlation (overrides config)'
+    )
+    parser.add_argument(
+        '--noise-beta-prior',
+        type=float,
+        help='Beta prior parameter for noise (overrides config)'
+    )
+    parser.add_argument(
+        '--K-prior',
+        type=float,
+        help='Prior parameter for dimension K (overrides config)'
+    )
+
+    # Output options
+    parser.add_argument(
+        '--output-dir',
+        default=None,
+        help='Output directory for results (overrides config)'
+    )
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help='Write indented JSON data and results files instead of compact ones'
+    )
+    parser.add_argument(
+        '--data-name',
+        default=None,
+        help='Name for the generated/loaded data (defaults to data.data_name or the data file name)'
+    )
+
+    # Logging options
+    parser.add_argument(
+        '--verbose',
+        '-v',
+        action='store_true',
+        help='Enable verbose output'
+    )
+    parser.add_argument(
+        '--debug',
+        action='store_true',
+        help='Enable debug logging'
+    )
+
+    return parser
@@ -3,17 +3,16 @@ Data generator module for partial order inference.
 """
 
 import os
-import json
-import yaml
+from functools import lru_cache
 import numpy as np
 from scipy.stats import beta
-from typing import Dict, List, Any
-from src.utils.basic_utils import BasicUtils
+from typing import Dict, List, Any, Optional
+from src.utils.basic_utils import BasicUtils, ensure_dir
+from src.utils.basic_utils import load_config as _load_config
 from src.utils.statistical_utils import StatisticalUtils
 from src.utils.generation_utils import GenerationUtils
-from src.visualization.po_plot import POPlot
-import matplotlib.pyplot as plt
 
+@lru_cache(maxsize=None)
 def get_project_root() -> str:
     """Get the absolute path to the project root directory."""
     return os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -22,6 +21,9 @@ def load_config(config_path: str) -> Dict[str, Any]:
     """
     Load configuration from YAML file.
     
+    Parsing is cached by basic_utils.load_config, keyed by the file's
+    modification time and size.
+    
     Args:
         config_path: Path to configuration file (relative to project root or absolute)
         
@@ -32,12 +34,14 @@ def load_config(config_path: str) -> Dict[str, Any]:
         # If relative path, make it relative to project root
         config_path = os.path.join(get_project_root(), config_path)
     
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    return _load_config(config_path)
 
-def generate_data(config: Dict[str, Any]) -> Dict[str, Any]:
+def generate_data(config: Dict[str, Any], rng: Optional[np.random.Generator] = None) -> Dict[str, Any]:
     """Generate synthetic data for partial order inference."""
     try:
+        if rng is None:
+            rng = np.random.default_rng(config.get('random_seed'))
+        
         # 1. Set up parameters
         n = config['generation']['n']  # Number of nodes
         N = config['generation']['N']  # Number of total orders
@@ -46,17 +50,17 @@ def generate_data(config: Dict[str, Any]) -> Dict[str, Any]:
         
         # 2. Generate latent positions and correlation parameter
         rho_prior = config['prior']['rho_prior']
-        rho_true = beta.rvs(1, rho_prior)
+        rho_true = beta.rvs(1, rho_prior, random_state=rng)
         print(f"True correlation parameter (rho): {rho_true:.4f}")
         
         # 3. Generate latent positions
-        U = GenerationUtils.generate_U(n, K, rho_true)
+        U = GenerationUtils.generate_U(n, K, rho_true, rng=rng)
         print("\nLatent positions (U):")
         print(U)
         
         # 4. Generate covariates and effects
-        X = np.random.randn(p, n)  # Generate random covariates
-        beta_true = np.random.randn(p)  # Generate random effects
+        X = rng.standard_normal((p, n))  # Generate random covariates
+        beta_true = rng.standard_normal(p)  # Generate random effects
         alpha = X.T @ beta_true  # Compute covariate effects
         print("\nCovariate effects (alpha):")
         print(alpha)
@@ -73,15 +77,11 @@ def generate_data(config: Dict[str, Any]) -> Dict[str, Any]:
         print(h_true)
         
         # 7. Generate subsets for sampling total orders
-        subsets = GenerationUtils.generate_subsets(N, n)
+        subsets = GenerationUtils.generate_subsets(N, n, rng=rng)
         
         # 8. Generate total orders
         h_tc = BasicUtils.transitive_closure(h)
-        total_orders = []
-        
-        for subset in subsets:
-            total_order = GenerationUtils.sample_total_order(h_tc, subset)
-            total_orders.append(total_order)
+        total_orders = GenerationUtils.sample_total_orders(h_tc, subsets, rng=rng)
         
         # 9. Prepare output data in the format expected by the inference module
         output_data = {
@@ -105,6 +105,10 @@ def generate_data(config: Dict[str, Any]) -> Dict[str, Any]:
         raise
 
 def main():
+    import json
+    import matplotlib.pyplot as plt
+    from src.visualization.po_plot import POPlot
+    
     try:
         # Load configuration
         config = load_config('config/mcmc_config.yaml')
@@ -112,7 +116,7 @@ def main():
         # Get project root and create output directory
         project_root = get_project_root()
         output_dir = os.path.join(project_root, config['output']['dir'])
-        os.makedirs(output_dir, exist_ok=True)
+        ensure_dir(output_dir)
         
         # Generate data
         data = generate_data(config)
@@ -120,7 +124,7 @@ def main():
         # Save data
         output_path = os.path.join(output_dir, config['output']['filename'])
         with open(output_path, 'w') as f:
-            json.dump(data, f, indent=2)
+            json.dump(data, f, separators=(',', ':'))
         
         print(f"\nData saved to {output_path}")
         
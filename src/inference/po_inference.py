@@ -1,24 +1,34 @@
 import os
 import json
 import yaml
+import itertools
+import multiprocessing
+from functools import lru_cache
 import numpy as np
-import matplotlib.pyplot as plt
-from typing import Dict, List, Any
-from src.utils.basic_utils import BasicUtils
-from src.utils.statistical_utils import StatisticalUtils
-from src.utils.generation_utils import GenerationUtils
-from src.visualization.po_plot import POPlot
+from typing import Dict, List, Any, Optional
+from src.utils.basic_utils import BasicUtils, save_json, ensure_dir
+from src.utils.basic_utils import load_config as _load_config
+from src.utils.config import McmcConfig
 from src.mcmc.mcmc_simulation import mcmc_partial_order
 
+# Minimum number of observed items for save_data to store observations as .npy.
+OBSERVATIONS_NPY_THRESHOLD = 100_000
 
+# Traces regrouped under results['trace'] for plotting.
+TRACE_KEYS = ['Z_trace', 'h_trace', 'rho_trace', 'prob_noise_trace', 'mallow_theta_trace']
+
+# Storage dtypes for traces whose values do not need 64 bits; h_trace only holds 0/1.
+TRACE_DTYPES = {'h_trace': np.int8}
+
+
+@lru_cache(maxsize=None)
 def get_project_root() -> str:
     return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
 def load_config(config_path: str) -> Dict[str, Any]:
-    """Load configuration from YAML file."""
+    """Load configuration from YAML file (cached, see basic_utils.load_config)."""
     try:
-        with open(config_path, 'r') as f:
-            return yaml.safe_load(f)
+        return _load_config(config_path)
     except FileNotFoundError:
         print(f"Config file not found at: {config_path}")
         raise
@@ -26,12 +36,50 @@ def load_config(config_path: str) -> Dict[str, Any]:
         print(f"Error parsing YAML file: {str(e)}")
         raise
 
+load_config.cache_clear = _load_config.cache_clear
+
+
+def save_data(data: Dict[str, Any], data_path: str, pretty: bool = False) -> None:
+    """
+    Save observation data to a JSON file (indented if ``pretty``).
+
+    For large datasets (at least OBSERVATIONS_NPY_THRESHOLD observed items in
+    total) the ragged ``total_orders``/``subsets`` lists are stored next to the
+    JSON file as ``<name>_observations.npy`` (a 2 x L int array holding both
+    lists flattened) and ``<name>_offsets.npy`` (start offsets of each
+    observation). load_data reads these binary arrays, which is faster than
+    decoding the same lists from JSON, and rebuilds the per-observation lists.
+    """
+    total_orders = data.get('total_orders', [])
+    subsets = data.get('subsets', [])
+    n_observed = sum(len(order) for order in total_orders)
+
+    if n_observed < OBSERVATIONS_NPY_THRESHOLD or len(total_orders) != len(subsets):
+        save_json(data, data_path, pretty=pretty)
+        return
+
+    lengths = np.array([len(order) for order in total_orders], dtype=np.int64)
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    observations = np.empty((2, offsets[-1]), dtype=np.int32)
+    observations[0] = list(itertools.chain.from_iterable(total_orders))
+    observations[1] = list(itertools.chain.from_iterable(subsets))
+
+    base_path = os.path.splitext(data_path)[0]
+    np.save(f"{base_path}_observations.npy", observations)
+    np.save(f"{base_path}_offsets.npy", offsets)
+
+    metadata = {key: value for key, value in data.items() if key not in ('total_orders', 'subsets')}
+    metadata['observations_file'] = os.path.basename(f"{base_path}_observations.npy")
+    metadata['offsets_file'] = os.path.basename(f"{base_path}_offsets.npy")
+    save_json(metadata, data_path, pretty=pretty)
+
 
 def load_data(data_path: str) -> Dict[str, Any]:
-    """Load data from JSON file."""
+    """Load data from JSON file (and its binary observation arrays, if any)."""
     try:
         with open(data_path, 'r') as f:
-            return json.load(f)
+            data = json.load(f)
     except FileNotFoundError:
         print(f"Data file not found at: {data_path}")
         raise
@@ -39,70 +87,164 @@ def load_data(data_path: str) -> Dict[str, Any]:
         print(f"Error parsing JSON file: {str(e)}")
         raise
 
-def run_inference(data: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any]:
-    """Run MCMC inference on the data."""
+    if 'observations_file' in data:
+        data_dir = os.path.dirname(data_path)
+        observations = np.load(os.path.join(data_dir, data.pop('observations_file')))
+        offsets = np.load(os.path.join(data_dir, data.pop('offsets_file'))).tolist()
+        flat_orders = observations[0].tolist()
+        flat_subsets = observations[1].tolist()
+        bounds = list(zip(offsets[:-1], offsets[1:]))
+        data['total_orders'] = [flat_orders[start:end] for start, end in bounds]
+        data['subsets'] = [flat_subsets[start:end] for start, end in bounds]
+    return data
+
+def _chain_seeds(rng: np.random.Generator, num_chains: int) -> List[int]:
+    """Derive independent per-chain seeds from a random generator."""
+    children = np.random.SeedSequence(int(rng.integers(2**63))).spawn(num_chains)
+    return [int(child.generate_state(1)[0]) for child in children]
+
+
+def _run_chain(data: Dict[str, Any], config: McmcConfig, seed: int) -> Dict[str, Any]:
+    """
+    Run a single MCMC chain with its own seed.
+
+    Defined at module level so it can be shipped to multiprocessing workers.
+    All of the sampler's draws come from a generator built from ``seed``, so
+    chains never share random state.
+    """
+    total_orders = data.get('total_orders', [])
+    subsets = data.get('subsets', [])
+    parameters = data.get('parameters', {})
+    n = len(set(itertools.chain.from_iterable(subsets)))
+
+    # Covariates (p x n) if available
+    X = np.asarray(data.get('X', parameters.get('X', np.zeros((config.p, n)))))
+
+    return mcmc_partial_order(
+        total_orders,
+        subsets,
+        config.num_iterations,
+        config.K,
+        X,
+        config.dr,
+        config.drbeta,
+        config.sigma_mallow,
+        config.sigma_beta,
+        config.noise_option,
+        list(config.mcmc_pt),
+        config.rho_prior,
+        config.noise_beta_prior,
+        config.mallow_ua,
+        seed
+    )
+
+
+def _combine_chains(chains: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Concatenate the traces of several chains, in chain order."""
+    combined = dict(chains[0])
+    for key, value in chains[0].items():
+        if isinstance(value, list):
+            combined[key] = [item for chain in chains for item in chain[key]]
+        elif isinstance(value, np.ndarray) and key in TRACE_KEYS:
+            combined[key] = np.concatenate([chain[key] for chain in chains])
+    combined['overall_acceptance_rate'] = float(np.mean([chain['overall_acceptance_rate'] for chain in chains]))
+    combined['chain_lengths'] = [len(chain.get('h_trace', [])) for chain in chains]
+    combined['num_chains'] = len(chains)
+    return combined
+
+
+def _post_burn_in_ranges(chain_lengths: List[int], burn_in: int) -> List[range]:
+    """Indices of the concatenated trace that remain after dropping burn-in from each chain."""
+    post_burn_in = []
+    chain_start = 0
+    for chain_length in chain_lengths:
+        chain_burn_in = burn_in
+        if chain_burn_in >= chain_length:
+            print(f"Warning: burn_in ({burn_in}) is larger than trace length ({chain_length}). Using last 1000 iterations.")
+            chain_burn_in = max(0, chain_length - 1000)
+        post_burn_in.append(range(chain_start + chain_burn_in, chain_start + chain_length))
+        chain_start += chain_length
+    return post_burn_in
+
+
+def _streaming_nanmean(samples) -> np.ndarray:
+    """
+    Element-wise mean of a sequence of equally shaped arrays, ignoring NaNs.
+
+    Equivalent to ``np.nanmean(np.stack(samples), axis=0)`` but accumulates in
+    a single pass, so only one sample is held in memory at a time.
+    """
+    total = None
+    count = None
+    for sample in samples:
+        sample = np.asarray(sample, dtype=np.float64)
+        if total is None:
+            total = np.zeros(sample.shape, dtype=np.float64)
+            count = np.zeros(sample.shape, dtype=np.int64)
+        valid = ~np.isnan(sample)
+        total[valid] += sample[valid]
+        count[valid] += 1
+    if total is None:
+        raise ValueError("No samples to average")
+    return np.where(count > 0, total / np.maximum(count, 1), np.nan)
+
+
+def run_inference(
+    data: Dict[str, Any],
+    config: Dict[str, Any],
+    num_chains: int = 1,
+    num_workers: Optional[int] = None,
+    rng: Optional[np.random.Generator] = None
+) -> Dict[str, Any]:
+    """
+    Run MCMC inference on the data.
+
+    With ``num_chains > 1`` independent chains are run in a process pool of
+    ``num_workers`` processes (default: one per chain, capped at the CPU count).
+    Their traces are concatenated, and burn-in is discarded per chain before
+    computing the final partial order.
+
+    The chain seeds are drawn from ``rng``; without one, a generator seeded
+    with the config's ``random_seed`` is used.
+    """
     try:
-        # Extract data
-        total_orders = data.get('total_orders', [])
-        subsets = data.get('subsets', [])
+        if num_chains < 1:
+            raise ValueError(f"num_chains must be at least 1, got {num_chains}")
+        if num_workers is not None and num_workers < 1:
+            raise ValueError(f"num_workers must be at least 1, got {num_workers}")
+        mcmc_config = McmcConfig.from_dict(config)
         parameters = data.get('parameters', {})
-
-        # Get MCMC parameters from config
-        num_iterations = config["mcmc"]["num_iterations"]
-        K=config["generation"]["K"]
-        mcmc_pt= [
-            config["mcmc"]["update_probabilities"]["rho"],
-            config["mcmc"]["update_probabilities"]["noise"],
-            config["mcmc"]["update_probabilities"]["U"]
-]
-        dr = config["rho"]["dr"]
-        noise_option = config["noise"]["noise_option"]
-        sigma_mallow = config["noise"]["sigma_mallow"]
-
-        # Get prior parameters
-        rho_prior = config["prior"]["rho_prior"]
-        noise_beta_prior = config["prior"]["noise_beta_prior"]
-        mallow_ua = config["prior"]["mallow_ua"]
-
-        # Get covariate effects if available
-        beta_true = parameters.get('beta_true', np.zeros(config['covariates']['p']))
-        X = parameters.get('X', np.zeros((len(total_orders), config['covariates']['p'])))
-        alpha = X @ beta_true
-
-        # Run MCMC simulation
-        mcmc_results = mcmc_partial_order(
-            total_orders,
-            subsets,
-            num_iterations,
-            K,
-            dr,
-            sigma_mallow,
-            noise_option,
-            mcmc_pt,
-            rho_prior,
-            noise_beta_prior,
-            mallow_ua,
-            alpha
-        )
+        beta_true = data.get('beta_true', parameters.get('beta_true', np.zeros(mcmc_config.p)))
+
+        if rng is None:
+            rng = np.random.default_rng(mcmc_config.random_seed)
+        seeds = _chain_seeds(rng, num_chains)
+        if num_chains > 1:
+            if num_workers is None:
+                num_workers = min(num_chains, os.cpu_count() or 1)
+            print(f"Running {num_chains} chains on {num_workers} worker processes...")
+            with multiprocessing.Pool(num_workers) as pool:
+                chains = pool.starmap(_run_chain, [(data, mcmc_config, seed) for seed in seeds])
+            mcmc_results = _combine_chains(chains)
+        else:
+            mcmc_results = _run_chain(data, mcmc_config, seeds[0])
+            mcmc_results['chain_lengths'] = [len(mcmc_results.get('h_trace', []))]
+            mcmc_results['num_chains'] = 1
 
         # Compute the final inferred partial order 'h' from the MCMC trace.
         if 'h_trace' in mcmc_results:
-            burn_in = int(config['visualization']['burn_in'])
-            h_trace = np.array(mcmc_results['h_trace'])
-
-            if burn_in >= len(h_trace):
-                print(f"Warning: burn_in ({burn_in}) is larger than trace length ({len(h_trace)}). Using last 1000 iterations.")
-                burn_in = max(0, len(h_trace) - 1000)
+            burn_in = mcmc_config.burn_in
+            h_trace = mcmc_results['h_trace']
+            post_burn_in = _post_burn_in_ranges(mcmc_results['chain_lengths'], burn_in)
 
-            post_burn_in_trace = h_trace[burn_in:]
-            if len(post_burn_in_trace) == 0:
+            if sum(len(indices) for indices in post_burn_in) == 0:
                 raise ValueError("No valid data after burn-in period")
 
             # Compute the mean over the trace (ignoring NaNs)
-            h_final = np.nanmean(post_burn_in_trace, axis=0)
+            h_final = _streaming_nanmean(h_trace[i] for indices in post_burn_in for i in indices)
             if np.any(np.isnan(h_final)):
                 print("Warning: NaN values detected in h_final. Using last valid state.")
-                h_final = h_trace[-1]
+                h_final = np.asarray(h_trace[-1])
 
             # Apply a threshold (e.g. 0.5) and perform transitive reduction
             threshold = 0.5
@@ -133,8 +275,7 @@ def run_inference(data: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any
             mcmc_results["prob_noise"] = 0.0
 
         # Package trace information into a 'trace' key for saving.
-        trace_keys = ['Z_trace', 'h_trace', 'rho_trace', 'prob_noise_trace', 'mallow_theta_trace']
-        trace_info = {key: mcmc_results.get(key, []) for key in trace_keys}
+        trace_info = {key: mcmc_results.get(key, []) for key in TRACE_KEYS}
         mcmc_results['trace'] = trace_info
 
         return mcmc_results
@@ -144,33 +285,57 @@ def run_inference(data: Dict[str, Any], config: Dict[str, Any]) -> Dict[str, Any
         raise
 
 
-def save_results(results: Dict[str, Any], output_dir: str, data_name: str):
-    """Save inference results to JSON file."""
+def _as_numeric_array(value: Any) -> Optional[np.ndarray]:
+    """Return value as a numeric ndarray if it is one (or a regular list of numbers), else None."""
+    if isinstance(value, np.ndarray):
+        return value if value.dtype.kind in 'biuf' else None
+    if isinstance(value, (list, tuple)) and len(value) > 0:
+        try:
+            array = np.asarray(value)
+        except ValueError:
+            return None
+        return array if array.dtype.kind in 'biuf' else None
+    return None
+
+
+def save_results(results: Dict[str, Any], output_dir: str, data_name: str, pretty: bool = False):
+    """
+    Save inference results.
+
+    Numeric arrays and traces are written to ``{data_name}_traces.npz``, with
+    list traces stacked into one contiguous array each (``h_trace`` as an
+    ``(iterations, n, n)`` int8 array, see TRACE_DTYPES); the remaining
+    (scalar, string and mapping) entries go to ``{data_name}_results.json``
+    (indented if ``pretty``). The ``trace`` entry is not stored separately,
+    as it only regroups top-level traces and is rebuilt by load_results.
+    """
     try:
         # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        ensure_dir(output_dir)
         
-        def convert_to_serializable(obj):
-            """Convert numpy arrays and other non-serializable objects to serializable format."""
-            if isinstance(obj, np.ndarray):
-                return obj.tolist()
-            elif isinstance(obj, dict):
-                return {k: convert_to_serializable(v) for k, v in obj.items()}
-            elif isinstance(obj, list):
-                return [convert_to_serializable(item) for item in obj]
-            elif isinstance(obj, tuple):
-                return tuple(convert_to_serializable(item) for item in obj)
+        # Split numeric arrays from metadata
+        arrays = {}
+        metadata = {}
+        for key, value in results.items():
+            if key == 'trace':
+                continue
+            array = _as_numeric_array(value)
+            if array is not None:
+                if key in TRACE_DTYPES:
+                    array = array.astype(TRACE_DTYPES[key], copy=False)
+                arrays[key] = np.ascontiguousarray(array)
             else:
-                return obj
+                metadata[key] = value
         
-        # Convert all numpy arrays to lists for JSON serialization
-        results_dict = convert_to_serializable(results)
+        # Save arrays to a compressed npz archive
+        traces_path = os.path.join(output_dir, f"{data_name}_traces.npz")
+        np.savez_compressed(traces_path, **arrays)
+        print(f"\nTraces saved to {traces_path}")
         
-        # Save results to JSON file
+        # Save remaining results to JSON file
         results_path = os.path.join(output_dir, f"{data_name}_results.json")
-        with open(results_path, 'w') as f:
-            json.dump(results_dict, f, indent=2)
-        print(f"\nResults saved to {results_path}")
+        save_json(metadata, results_path, pretty=pretty)
+        print(f"Results saved to {results_path}")
         
         # Save partial order matrix separately as numpy array
         if 'h' in results:
@@ -182,11 +347,37 @@ def save_results(results: Dict[str, Any], output_dir: str, data_name: str):
         print(f"Error in save_results: {str(e)}")
         raise
 
+
+def load_results(output_dir: str, data_name: str) -> Dict[str, Any]:
+    """Load inference results written by save_results."""
+    try:
+        results_path = os.path.join(output_dir, f"{data_name}_results.json")
+        with open(results_path, 'r') as f:
+            results = json.load(f)
+        
+        traces_path = os.path.join(output_dir, f"{data_name}_traces.npz")
+        with np.load(traces_path, allow_pickle=False) as arrays:
+            for key in arrays.files:
+                results[key] = arrays[key]
+        
+        results['trace'] = {key: results.get(key, []) for key in TRACE_KEYS}
+        return results
+        
+    except FileNotFoundError as e:
+        print(f"Results file not found: {str(e)}")
+        raise
+
+
 def generate_plots(results: Dict[str, Any], data: Dict[str, Any], config: Dict[str, Any], output_dir: str, data_name: str):
     """Generate and save plots."""
+    # Plotting is optional, so matplotlib is only loaded when plots are made
+    import matplotlib.pyplot as plt
+    from src.visualization.po_plot import POPlot
+
+    fig = None
     try:
         # Create output directory if it doesn't exist
-        os.makedirs(output_dir, exist_ok=True)
+        ensure_dir(output_dir)
 
         # Get true parameters if they exist
         true_param = {}
@@ -213,16 +404,18 @@ def generate_plots(results: Dict[str, Any], data: Dict[str, Any], config: Dict[s
         # Plot partial orders
         items = data.get('items', {}).get('names', [f"Item {i}" for i in range(results['h'].shape[0])])
 
+        # Both partial order plots are drawn on one reused figure
+        fig, ax = plt.subplots(figsize=(10, 8))
+
         # Plot inferred partial order
         inferred_plot_path = os.path.join(output_dir, f"{data_name}_inferred_po.pdf")
-        plt.figure(figsize=(10, 8))
         POPlot.visualize_partial_order(
             final_h=results['h'],
             Ma_list=items,
-            title='Inferred Partial Order'
+            title='Inferred Partial Order',
+            ax=ax
         )
-        plt.savefig(inferred_plot_path)
-        plt.close()
+        fig.savefig(inferred_plot_path)
         print(f"Inferred partial order plot saved to {inferred_plot_path}")
 
         # If true partial order exists in data, convert it to a numpy array before processing.
@@ -231,14 +424,14 @@ def generate_plots(results: Dict[str, Any], data: Dict[str, Any], config: Dict[s
             if isinstance(true_po, list):
                 true_po = np.array(true_po)
             true_plot_path = os.path.join(output_dir, f"{data_name}_true_po.pdf")
-            plt.figure(figsize=(10, 8))
+            ax.clear()
             POPlot.visualize_partial_order(
                 final_h=BasicUtils.transitive_reduction(true_po),
                 Ma_list=items,
-                title='True Partial Order'
+                title='True Partial Order',
+                ax=ax
             )
-            plt.savefig(true_plot_path)
-            plt.close()
+            fig.savefig(true_plot_path)
             print(f"True partial order plot saved to {true_plot_path}")
 
             # Compare relationships
@@ -271,6 +464,10 @@ def generate_plots(results: Dict[str, Any], data: Dict[str, Any], config: Dict[s
     except Exception as e:
         print(f"Error in generate_plots: {str(e)}")
         raise
+    finally:
+        # The partial order figure is shared by both plots; close it even on errors
+        if fig is not None:
+            plt.close(fig)
 
 
 def main():
@@ -290,7 +487,7 @@ def main():
 
         # Create output directory if it doesn't exist
         output_dir = os.path.join(project_root, config['data']['output_dir'])
-        os.makedirs(output_dir, exist_ok=True)
+        ensure_dir(output_dir)
 
         # Run inference
         results = run_inference(data, config)
@@ -2,7 +2,32 @@
 MCMC implementation for partial order inference.
 """
 
-from .mcmc_simulation import mcmc_partial_order
-from .likelihood_cache import LogLikelihoodCache
+import os
+import importlib
 
-__all__ = ['mcmc_partial_order', 'LogLikelihoodCache'] 
\ No newline at end of file
+__all__ = ['mcmc_partial_order', 'LogLikelihoodCache']
+
+# Imported on first attribute access (PEP 562), see src/utils/__init__.py;
+# PO_EAGER_IMPORT=1 resolves them at import time.
+_ATTRIBUTE_MODULES = {
+    'mcmc_partial_order': 'mcmc_simulation',
+    'LogLikelihoodCache': 'likelihood_cache',
+}
+
+
+def __getattr__(name):
+    if name in _ATTRIBUTE_MODULES:
+        module = importlib.import_module(f'.{_ATTRIBUTE_MODULES[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
+
+
+if os.environ.get('PO_EAGER_IMPORT') == '1':
+    for _name in __all__:
+        __getattr__(_name)
@@ -67,13 +67,14 @@ class LogLikelihoodCache:
             m = len(y_i)
 
             if noise_option == "queue_jump":
+                y_i_arr = np.asarray(y_i)
                 for j, y_j in enumerate(y_i):
-                    remaining_indices = y_i[j:]
-                    h_Z_remaining = h_Z[np.ix_(remaining_indices, remaining_indices)]
+                    remaining_arr = y_i_arr[j:]
+                    h_Z_remaining = h_Z[remaining_arr[:, None], remaining_arr]
                     tr_remaining = BasicUtils.transitive_reduction(h_Z_remaining)
                     num_le = cls._get_nle(tr_remaining)
-                    local_idx = remaining_indices.index(y_j)
-                    num_first_item = cls._get_nle_first(tr_remaining, local_idx)
+                    # y_j is the first of the remaining items
+                    num_first_item = cls._get_nle_first(tr_remaining, 0)
 
                     prob_no_jump = (1 - prob_noise) * (num_first_item / num_le)
                     prob_jump = prob_noise * (1 / (m - j))
@@ -4,7 +4,6 @@ MCMC implementation for partial order inference.
 
 import sys
 import itertools
-import random
 import numpy as np
 from typing import List, Dict, Any
 from scipy.stats import beta, gamma
@@ -58,10 +57,10 @@ def mcmc_partial_order(
     h_Z = BasicUtils.generate_partial_order(eta)  # partial order from Z
 
     # Initialize parameters using the provided prior hyperparameters.
-    rho = StatisticalUtils.rRprior(rho_prior)  # initial rho from its prior
+    rho = StatisticalUtils.rRprior(rho_prior, rng=rng)  # initial rho from its prior
 
-    prob_noise =  StatisticalUtils.rPprior(noise_beta_prior)  # Beta(1, noise_beta_prior)
-    mallow_theta =  StatisticalUtils.rTprior(mallow_ua)
+    prob_noise =  StatisticalUtils.rPprior(noise_beta_prior, rng=rng)  # Beta(1, noise_beta_prior)
+    mallow_theta =  StatisticalUtils.rTprior(mallow_ua, rng=rng)
 
 
     # ----------------------------------------------------------------
@@ -81,7 +80,9 @@ def mcmc_partial_order(
     acceptance_rates = []
     log_likelihood_currents = []
     log_likelihood_primes = []
-    h_trace = []
+    # One 0/1 partial order is stored every 100 iterations; preallocate them
+    # as a single contiguous stack instead of a list of per-sample copies.
+    h_trace = np.empty((num_iterations // 100, n, n), dtype=np.int8)
     num_acceptances = 0
 
 
@@ -95,11 +96,11 @@ def mcmc_partial_order(
     # 3. Main MCMC Loop
     # ----------------------------------------------------------------
     for iteration in range(1, num_iterations + 1):
-        r = random.random()
+        r = rng.random()
 
         # ---- A) Update rho ----
         if r < rho_pct:
-            delta = random.uniform(dr, 1.0 / dr)
+            delta = rng.uniform(dr, 1.0 / dr)
             rho_prime = 1.0 - (1.0 - rho) * delta
             if not (0.0 < rho_prime < 1.0):
                 rho_prime = rho
@@ -122,7 +123,7 @@ def mcmc_partial_order(
             log_likelihood_primes.append(log_likelihood_proposed_value)
 
             acceptance_probability = min(1.0, np.exp(log_acceptance_ratio))
-            if random.random() < acceptance_probability:
+            if rng.random() < acceptance_probability:
                 rho = rho_prime
                 num_acceptances += 1
                 acceptance_decisions.append(1)
@@ -133,7 +134,7 @@ def mcmc_partial_order(
         # ---- B) Update noise parameter ----
         elif r < (rho_pct + noise_pct):
             if noise_option == "mallows_noise":
-                epsilon = np.random.normal(0, 1)
+                epsilon = rng.normal(0, 1)
                 mallow_theta_prime = mallow_theta * np.exp(sigma_mallow * epsilon)
 
                 log_prior_current = StatisticalUtils.dTprior(mallow_theta, ua=mallow_ua)
@@ -153,7 +154,7 @@ def mcmc_partial_order(
 
                 log_acceptance_ratio = (log_prior_proposed + llk_prime) - (log_prior_current + llk_current)+ np.log(mallow_theta / mallow_theta_prime)
                 acceptance_probability = min(1.0, np.exp(log_acceptance_ratio))
-                if random.random() < acceptance_probability:
+                if rng.random() < acceptance_probability:
                     mallow_theta = mallow_theta_prime
                     num_acceptances += 1
                     acceptance_decisions.append(1)
@@ -162,7 +163,7 @@ def mcmc_partial_order(
                 proposed_mallow_theta_vals.append(mallow_theta_prime)
 
             elif noise_option == "queue_jump":
-                prob_noise_prime = StatisticalUtils.rPprior(noise_beta_prior)
+                prob_noise_prime = StatisticalUtils.rPprior(noise_beta_prior, rng=rng)
 
                 log_prior_current = StatisticalUtils.dPprior(prob_noise, beta_param=noise_beta_prior)
                 log_prior_proposed = StatisticalUtils.dPprior(prob_noise_prime, beta_param=noise_beta_prior)
@@ -181,7 +182,7 @@ def mcmc_partial_order(
 
                 log_acceptance_ratio = llk_prime -llk_current
                 acceptance_probability = min(1.0, np.exp(log_acceptance_ratio))
-                if random.random() < acceptance_probability:
+                if rng.random() < acceptance_probability:
                     prob_noise = prob_noise_prime
                     num_acceptances += 1
                     acceptance_decisions.append(1)
@@ -191,14 +192,14 @@ def mcmc_partial_order(
 
         # ---- C) Update U (latent matrix Z) via a single row update ----
         elif r <= (rho_pct + noise_pct + U_pct):
-            i = random.randint(0, n - 1)
+            i = rng.integers(n)
             current_row = Z[i, :].copy()
             # Build a proposal covariance matrix for the row update.
             # For example, we build a matrix with off-diagonals equal to rho and diagonal equal to 1.
             Sigma  = BasicUtils.build_Sigma_rho( K,rho)
 
 
-            proposed_row = np.random.multivariate_normal(current_row, Sigma)
+            proposed_row = rng.multivariate_normal(current_row, Sigma)
             Z_prime = Z.copy()
             Z_prime[i, :] = proposed_row
             eta_prime = StatisticalUtils.transform_U_to_eta(Z_prime, alpha)
@@ -222,7 +223,7 @@ def mcmc_partial_order(
 
             log_acceptance_ratio = (log_prior_proposed + llk_prime) - (log_prior_current + llk_current)
             acceptance_probability = min(1.0, np.exp(log_acceptance_ratio))
-            if random.random() < acceptance_probability:
+            if rng.random() < acceptance_probability:
                 Z = Z_prime
                 h_Z = h_Z_prime
                 num_acceptances += 1
@@ -255,7 +256,7 @@ def mcmc_partial_order(
             log_likelihood_currents.append(llk_current)
             log_likelihood_primes.append(llk_prime)
             
-            if random.random() < acceptance_probability:
+            if rng.random() < acceptance_probability:
                 beta = beta_prime
                 alpha = alpha_prime
                 h_Z = h_Z_prime
@@ -269,7 +270,7 @@ def mcmc_partial_order(
         # Store current state. 
         if iteration % 100 == 0:
             Z_trace.append(Z.copy())
-            h_trace.append(h_Z.copy())
+            h_trace[iteration // 100 - 1] = h_Z
             beta_trace.append(beta.copy())
             rho_trace.append(rho)
             prob_noise_trace.append(prob_noise)
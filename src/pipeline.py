@@ -0,0 +1,188 @@
+"""
+Data generation and inference pipeline for partial order inference.
+
+This module holds the generate -> infer -> save -> plot pipeline driven by
+``src.cli.main``, which backs all command-line entry points (``main.py``,
+``scripts/main.py``, ``python -m src`` and the ``po-inference`` console script).
+"""
+
+import os
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Optional
+
+import numpy as np
+
+# Plots are only ever written to files, so default to the non-interactive Agg
+# backend before anything imports matplotlib; MPLBACKEND still overrides this.
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+from src.data.data_generator import generate_data
+from src.inference.po_inference import (
+    run_inference, save_results, load_results, generate_plots, save_data, load_data
+)
+from src.utils.basic_utils import ensure_dir
+
+
+@lru_cache(maxsize=None)
+def get_project_root() -> str:
+    """Get the absolute path to the project root directory."""
+    return os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def update_config_with_args(config: Dict[str, Any], args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Update configuration with command line arguments.
+
+    The config is updated in place (it is a fresh dict from load_config), and
+    only the keys that were actually overridden on the command line are touched.
+    """
+    if args.iterations is not None:
+        config.setdefault('mcmc', {})['num_iterations'] = args.iterations
+    if args.burn_in is not None:
+        config.setdefault('visualization', {})['burn_in'] = args.burn_in
+    if args.thinning is not None:
+        config.setdefault('mcmc', {})['thinning'] = args.thinning
+    if args.dimension is not None:
+        # The sampler and the data generator both read generation.K
+        config.setdefault('mcmc', {})['K'] = args.dimension
+        config.setdefault('generation', {})['K'] = args.dimension
+    if args.noise_model is not None:
+        config.setdefault('noise', {})['noise_option'] = args.noise_model
+    if args.n_items is not None:
+        config.setdefault('generation', {})['n'] = args.n_items
+    if args.n_observations is not None:
+        config.setdefault('generation', {})['N'] = args.n_observations
+    if args.rho_prior is not None:
+        config.setdefault('prior', {})['rho_prior'] = args.rho_prior
+    if args.noise_beta_prior is not None:
+        config.setdefault('prior', {})['noise_beta_prior'] = args.noise_beta_prior
+    if args.K_prior is not None:
+        config.setdefault('prior', {})['K_prior'] = args.K_prior
+    if args.output_dir is not None:
+        config.setdefault('data', {})['output_dir'] = args.output_dir
+    if args.data_file is not None:
+        config.setdefault('data', {})['path'] = args.data_file
+    if args.seed is not None:
+        config['random_seed'] = args.seed
+    if args.generate_data:
+        config.setdefault('data', {})['generate_data'] = True
+    if args.no_generate_data:
+        config.setdefault('data', {})['generate_data'] = False
+    return config
+
+
+def save_generated_data(data: Dict[str, Any], output_dir: str, data_name: str, pretty: bool = False) -> str:
+    """Save generated data to JSON file."""
+    try:
+        ensure_dir(output_dir)
+        data_path = os.path.join(output_dir, f"{data_name}.json")
+        save_data(data, data_path, pretty=pretty)
+        print(f"\nGenerated data saved to {data_path}")
+        return data_path
+    except Exception as e:
+        print(f"Error in save_generated_data: {str(e)}")
+        raise
+
+
+def run_pipeline(
+    config: Dict[str, Any],
+    project_root: str,
+    data_gen_config: Optional[Dict[str, Any]] = None,
+    data_name: Optional[str] = None,
+    generate_only: bool = False,
+    inference_only: bool = False,
+    plot_only: bool = False,
+    num_chains: int = 1,
+    num_workers: Optional[int] = None,
+    plots: bool = True,
+    pretty: bool = False
+) -> None:
+    """
+    Run data generation, inference, result saving and plotting.
+
+    Parameters:
+    -----------
+    config : Dict[str, Any]
+        MCMC configuration
+    project_root : str
+        Directory that relative paths in the config are resolved against
+    data_gen_config : Dict[str, Any], optional
+        Data generation configuration; defaults to the MCMC configuration
+    data_name : str, optional
+        Name for the generated/loaded data; defaults to ``data.data_name`` for
+        generated data and to the data file name for loaded data
+    generate_only : bool
+        Stop after generating and saving synthetic data
+    inference_only : bool
+        Skip data generation and load the data file from ``data.path``
+    plot_only : bool
+        Load the data file and previously saved results and only plot them
+    num_chains : int
+        Number of independent MCMC chains
+    num_workers : int, optional
+        Number of worker processes used to run the chains
+    plots : bool
+        Generate plots after inference; ignored in plot-only mode
+    pretty : bool
+        Write indented instead of compact JSON files
+    """
+    if data_gen_config is None:
+        data_gen_config = config
+
+    # One generator drives data generation and the chain seeds, so a fixed
+    # random_seed reproduces the whole run
+    rng = np.random.default_rng(config.get('random_seed'))
+
+    # Set up output directory
+    output_dir = os.path.join(project_root, config['data']['output_dir'])
+    ensure_dir(output_dir)
+    print(f"Output directory: {output_dir}")
+
+    # Generate or load data
+    if generate_only or (not (inference_only or plot_only) and config['data'].get('generate_data', True)):
+        print("\nGenerating synthetic data...")
+        data = generate_data(data_gen_config, rng=rng)
+        if data_name is None:
+            data_name = config['data'].get('data_name', 'synthetic_data')
+        data_path = save_generated_data(data, output_dir, data_name, pretty=pretty)
+        config['data']['path'] = os.path.relpath(data_path, project_root)
+
+        if generate_only:
+            print("Data generation completed successfully.")
+            return
+    else:
+        data_path = os.path.join(project_root, config['data']['path'])
+        if not os.path.exists(data_path):
+            raise FileNotFoundError(f"Data file not found at: {data_path}")
+        print(f"\nLoading data from: {data_path}")
+        data = load_data(data_path)
+        if data_name is None:
+            data_name = os.path.splitext(os.path.basename(data_path))[0]
+
+    if plot_only:
+        print("\nLoading saved results...")
+        results = load_results(output_dir, data_name)
+
+        print("\nGenerating plots...")
+        generate_plots(results, data, config, output_dir, data_name)
+    else:
+        # Run inference
+        print("\nRunning MCMC inference...")
+        results = run_inference(data, config, num_chains=num_chains, num_workers=num_workers, rng=rng)
+
+        if not plots:
+            print("\nSaving results...")
+            save_results(results, output_dir, data_name, pretty=pretty)
+        else:
+            # Save results in a worker thread while the plots are rendered. Neither
+            # stage modifies results, and plotting stays on the calling thread
+            # because GUI matplotlib backends require the main thread.
+            print("\nSaving results and generating plots...")
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                saved = executor.submit(save_results, results, output_dir, data_name, pretty)
+                generate_plots(results, data, config, output_dir, data_name)
+                saved.result()
+
+    print("\nAnalysis completed successfully!")
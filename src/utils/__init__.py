@@ -2,8 +2,36 @@
 Utility functions for partial order inference.
 """
 
-from .basic_utils import BasicUtils
-from .statistical_utils import StatisticalUtils
-from .generation_utils import GenerationUtils
+import os
+import importlib
 
-__all__ = ['BasicUtils', 'StatisticalUtils', 'GenerationUtils'] 
\ No newline at end of file
+__all__ = ['BasicUtils', 'StatisticalUtils', 'GenerationUtils', 'McmcConfig']
+
+# The utility classes are imported from their modules on first attribute
+# access (PEP 562), so that e.g. ``from src.utils.config import McmcConfig``
+# does not pull in numpy, scipy and numba. Set PO_EAGER_IMPORT=1 to resolve
+# them at import time instead (surfaces import errors early, e.g. in CI).
+_ATTRIBUTE_MODULES = {
+    'BasicUtils': 'basic_utils',
+    'StatisticalUtils': 'statistical_utils',
+    'GenerationUtils': 'generation_utils',
+    'McmcConfig': 'config',
+}
+
+
+def __getattr__(name):
+    if name in _ATTRIBUTE_MODULES:
+        module = importlib.import_module(f'.{_ATTRIBUTE_MODULES[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
+
+
+if os.environ.get('PO_EAGER_IMPORT') == '1':
+    for _name in __all__:
+        __getattr__(_name)
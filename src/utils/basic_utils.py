@@ -3,26 +3,293 @@ Basic utility functions for partial order operations.
 """
 
 import os
+import copy
+import json
 import yaml
 import numpy as np
-import networkx as nx
 import math
+from collections import OrderedDict
 from typing import List, Dict, Set, Any, Optional
 import itertools
 from functools import lru_cache
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit when numba is not installed: return the function unchanged."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Above this many items generate_partial_order uses the numba kernel instead of
+# broadcasting, whose n x n x K temporaries start to dominate.
+PARTIAL_ORDER_JIT_THRESHOLD = 200
+
+# Parsed configs keyed by absolute path, validated against (st_mtime_ns, st_size).
+_CONFIG_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_CONFIG_CACHE_MAXSIZE = 100
+
 def load_config(config_path: str) -> Dict[str, Any]:
     """
     Load configuration from YAML file.
     
+    Parsed files are cached in-process and re-parsed only when the file's
+    modification time or size changes. Each call returns a deep copy, so
+    callers are free to mutate the result. Across processes, a JSON copy of
+    the parsed config is kept next to the YAML file (``<path>.json``),
+    together with the YAML file's modification time and size, and is used
+    only while both still match exactly. Call ``load_config.cache_clear()``
+    to drop both caches for the configs loaded so far.
+    
     Args:
         config_path: Path to the YAML configuration file
         
     Returns:
         Dictionary containing the configuration
     """
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
+    path = os.path.abspath(config_path)
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+
+    cached = _CONFIG_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        _CONFIG_CACHE.move_to_end(path)
+        return copy.deepcopy(cached[1])
+
+    config = _load_config_sidecar(path, stamp)
+    if config is None:
+        with open(path, 'r') as f:
+            config = yaml.load(f, Loader=SafeLoader)
+        _write_config_sidecar(path, stamp, config)
+
+    _CONFIG_CACHE[path] = (stamp, config)
+    _CONFIG_CACHE.move_to_end(path)
+    if len(_CONFIG_CACHE) > _CONFIG_CACHE_MAXSIZE:
+        _CONFIG_CACHE.popitem(last=False)
+    return copy.deepcopy(config)
+
+def _clear_config_cache() -> None:
+    """
+    Forget every config loaded so far, including their JSON copies on disk.
+    
+    The cached copies are validated by the YAML file's (mtime, size), so this
+    is only needed when a file is rewritten with the same size within the
+    file system's timestamp resolution; the next load re-parses the YAML.
+    """
+    for path in _CONFIG_CACHE:
+        try:
+            os.remove(path + '.json')
+        except OSError:
+            pass
+    _CONFIG_CACHE.clear()
+
+# Same name as functools.lru_cache's
+load_config.cache_clear = _clear_config_cache
+
+def _load_config_sidecar(path: str, stamp: tuple) -> Optional[Dict[str, Any]]:
+    """Return the JSON copy of a YAML config if it was made from this (st_mtime_ns, st_size), else None."""
+    cache_path = path + '.json'
+    try:
+        with open(cache_path, 'rb') as f:
+            text = f.read()
+        sidecar = orjson.loads(text) if orjson is not None else json.loads(text)
+        if not isinstance(sidecar, dict) or sidecar.get('source') != list(stamp):
+            return None
+        return sidecar.get('config')
+    except (OSError, ValueError):
+        return None
+
+def _write_config_sidecar(path: str, stamp: tuple, config: Dict[str, Any]) -> bool:
+    """
+    Atomically write a JSON copy of a parsed YAML config next to it.
+    
+    The copy records the (st_mtime_ns, st_size) of the YAML file it was parsed
+    from. Configs that do not survive a JSON round trip unchanged (e.g.
+    non-string keys or dates) are not cached, and read-only trees are
+    silently skipped. Returns True if the copy was written.
+    """
+    cache_path = path + '.json'
+    tmp_path = cache_path + '.tmp'
+    sidecar = {'source': list(stamp), 'config': config}
+    try:
+        if orjson is not None:
+            text = orjson.dumps(sidecar, option=orjson.OPT_INDENT_2)
+            if orjson.loads(text) != sidecar:
+                return False
+        else:
+            text = json.dumps(sidecar, indent=2).encode()
+            if json.loads(text) != sidecar:
+                return False
+        with open(tmp_path, 'wb') as f:
+            f.write(text)
+        os.replace(tmp_path, cache_path)
+        return True
+    except (OSError, TypeError, ValueError):
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        return False
+
+def compile_configs(config_dir: str) -> List[str]:
+    """
+    Write the JSON copy of every ``*.yaml`` config in a directory.
+    
+    load_config picks these copies up on the next run without touching the
+    YAML parser; the YAML files stay the editable source of truth.
+    
+    Args:
+        config_dir: Directory containing the YAML configuration files
+        
+    Returns:
+        Paths of the JSON files written
+    """
+    written = []
+    for name in sorted(os.listdir(config_dir)):
+        if not name.endswith(('.yaml', '.yml')):
+            continue
+        path = os.path.abspath(os.path.join(config_dir, name))
+        st = os.stat(path)
+        with open(path, 'r') as f:
+            config = yaml.load(f, Loader=SafeLoader)
+        if _write_config_sidecar(path, (st.st_mtime_ns, st.st_size), config):
+            written.append(path + '.json')
+    return written
+
+# Directories already created by ensure_dir in this process.
+_ENSURED: Set[str] = set()
+
+def ensure_dir(path: str) -> str:
+    """
+    Create a directory (and its parents) unless this process already did.
+
+    Parameters:
+    -----------
+    path : str
+        Directory to create
+
+    Returns:
+    --------
+    str
+        The path that was passed in
+    """
+    key = os.path.abspath(path)
+    if key not in _ENSURED:
+        os.makedirs(key, exist_ok=True)
+        _ENSURED.add(key)
+    return path
+
+def _json_default(obj: Any) -> Any:
+    """Convert the numpy values the JSON encoders cannot serialize natively."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+def save_json(data: Any, path: str, pretty: bool = False) -> None:
+    """
+    Write data to a JSON file, compact by default.
+    
+    Uses orjson when it is installed, which serializes numpy arrays and
+    scalars straight from their buffers; otherwise the standard library
+    encoder is used, calling back into _json_default only for numpy values.
+    
+    Args:
+        data: JSON-serializable object, possibly containing numpy arrays/scalars
+        path: Destination file path
+        pretty: Indent by two spaces for human inspection
+    """
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(data, default=_json_default, option=option))
+    else:
+        with open(path, 'w') as f:
+            if pretty:
+                json.dump(data, f, indent=2, default=_json_default)
+            else:
+                json.dump(data, f, separators=(',', ':'), default=_json_default)
+
+@njit(cache=True, boundscheck=False)
+def _transitive_reduction_kernel(tr: np.ndarray) -> None:
+    """In-place Floyd-Warshall style edge removal used by BasicUtils.transitive_reduction."""
+    n = tr.shape[0]
+    for k in range(n):
+        for i in range(n):
+            for j in range(n):
+                if tr[i, k] and tr[k, j]:
+                    tr[i, j] = 0  # Remove direct edge if there's an indirect path
+
+@njit(cache=True, parallel=True)
+def _transitive_reduction_batch_kernel(tr: np.ndarray) -> None:
+    """Apply _transitive_reduction_kernel in place to each matrix of an (m, n, n) stack."""
+    for s in prange(tr.shape[0]):
+        _transitive_reduction_kernel(tr[s])
+
+@njit(cache=True, boundscheck=False)
+def _transitive_closure_kernel(closure: np.ndarray) -> None:
+    """In-place Warshall closure of a boolean matrix: rows reaching k absorb row k."""
+    n = closure.shape[0]
+    for k in range(n):
+        for i in range(n):
+            if closure[i, k]:
+                for j in range(n):
+                    if closure[k, j]:
+                        closure[i, j] = True
+
+@njit(cache=True, parallel=True)
+def _partial_order_kernel(eta: np.ndarray, h: np.ndarray) -> None:
+    """Fill h[i, j] = 1 where eta[i] dominates eta[j] (>= everywhere, > somewhere)."""
+    n, K = eta.shape
+    for i in prange(n):
+        for j in range(n):
+            dominates = True
+            strict = False
+            for k in range(K):
+                if not eta[i, k] >= eta[j, k]:
+                    dominates = False
+                    break
+                if eta[i, k] > eta[j, k]:
+                    strict = True
+            if dominates and strict:
+                h[i, j] = 1
+
+def warmup_jit() -> bool:
+    """
+    Compile the numba kernels for the dtypes used by the sampler.
+    
+    Kernels are compiled with ``cache=True``, so running this once (e.g. after
+    installation) moves the JIT compilation cost out of the first inference run.
+    
+    Returns:
+        True if numba is available and the kernels were compiled
+    """
+    if not NUMBA_AVAILABLE:
+        return False
+    for dtype in (np.int64, np.bool_):
+        _transitive_reduction_kernel(np.zeros((2, 2), dtype=dtype))
+        _transitive_reduction_batch_kernel(np.zeros((1, 2, 2), dtype=dtype))
+    _transitive_closure_kernel(np.zeros((2, 2), dtype=np.bool_))
+    _partial_order_kernel(np.zeros((2, 2)), np.zeros((2, 2), dtype=int))
+    return True
 
 class BasicUtils:
     """
@@ -45,7 +312,7 @@ class BasicUtils:
         """
         try:
             with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=SafeLoader)
             return config
         except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found at: {config_path}")
@@ -146,13 +413,16 @@ class BasicUtils:
             Binary matrix representing the partial order (n × n)
         """
         n = eta.shape[0]
-        h = np.zeros((n, n), dtype=int)
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    if np.all(eta[i] >= eta[j]) and np.any(eta[i] > eta[j]):
-                        h[i, j] = 1
-        return h
+        if NUMBA_AVAILABLE and n > PARTIAL_ORDER_JIT_THRESHOLD:
+            h = np.zeros((n, n), dtype=int)
+            _partial_order_kernel(np.ascontiguousarray(eta, dtype=np.float64), h)
+            return h
+        # i dominates j if eta[i] >= eta[j] in every dimension and > in at least one
+        # (which also rules out i == j)
+        left = eta[:, None, :]
+        right = eta[None, :, :]
+        dominates = np.all(left >= right, axis=2) & np.any(left > right, axis=2)
+        return dominates.astype(int)
 
     @staticmethod
     def is_total_order(adj_matrix: np.ndarray) -> bool:
@@ -185,16 +455,31 @@ class BasicUtils:
         np.ndarray
             Transitive reduction of the input matrix
         """
-        n = h.shape[0]
-        tr = h.copy()
+        tr = np.array(h, copy=True)
+        # Floyd-Warshall style pass, compiled with numba when available
+        _transitive_reduction_kernel(tr)
+        return tr
 
-        # Floyd-Warshall algorithm for transitive closure
-        for k in range(n):
-            for i in range(n):
-                for j in range(n):
-                    if tr[i, k] and tr[k, j]:
-                        tr[i, j] = 0  # Remove direct edge if there's an indirect path
+    @staticmethod
+    def transitive_reduction_batch(hs: np.ndarray) -> np.ndarray:
+        """
+        Compute the transitive reduction of each matrix in a stack.
 
+        The matrices are independent, so with numba they are reduced in
+        parallel (the k loop inside a single reduction is sequential).
+
+        Parameters:
+        -----------
+        hs : np.ndarray
+            m x n x n stack of binary partial order matrices (e.g. posterior samples)
+
+        Returns:
+        --------
+        np.ndarray
+            Stack of the transitive reductions, same shape and dtype as the input
+        """
+        tr = np.array(hs, copy=True)
+        _transitive_reduction_batch_kernel(tr)
         return tr
 
     @staticmethod
@@ -208,14 +493,51 @@ class BasicUtils:
         Returns:
         - closure: An n x n numpy array representing the adjacency matrix of the transitive closure.
         """
-        n = adj_matrix.shape[0]
         closure = adj_matrix.copy()
-        for k in range(n):
-            for i in range(n):
-                for j in range(n):
-                    closure[i, j] = closure[i, j] or (closure[i, k] and closure[k, j])
+        if NUMBA_AVAILABLE:
+            reach = adj_matrix != 0
+            _transitive_closure_kernel(reach)
+        else:
+            reach = BasicUtils.transitive_closure_bitset(adj_matrix)
+        # Keep the existing entries as they are and only add the implied relations
+        closure[reach & (adj_matrix == 0)] = 1
         return closure
 
+    @staticmethod
+    def transitive_closure_bitset(h: np.ndarray) -> np.ndarray:
+        """
+        Compute the transitive closure of a relation with bit-packed rows.
+
+        Each row is packed into ceil(n / 64) uint64 words, so Warshall's inner
+        loop over j becomes a handful of word-wide ORs: for every k, each row i
+        that reaches k absorbs row k. transitive_closure uses this when numba
+        is not installed.
+
+        Parameters:
+        -----------
+        h : np.ndarray
+            n x n adjacency matrix (any non-zero entry is a relation)
+
+        Returns:
+        --------
+        np.ndarray
+            Boolean n x n matrix of the transitive closure
+        """
+        n = h.shape[0]
+        if n == 0:
+            return np.zeros((0, 0), dtype=bool)
+        n_words = (n + 63) // 64
+        packed = np.zeros((n, n_words * 8), dtype=np.uint8)
+        bits = np.packbits(h != 0, axis=1, bitorder='little')
+        packed[:, :bits.shape[1]] = bits
+        rows = packed.view('<u8')
+
+        for k in range(n):
+            reaches_k = ((rows[:, k >> 6] >> np.uint64(k & 63)) & np.uint64(1)).astype(bool)
+            rows[reaches_k] |= rows[k]
+
+        return np.unpackbits(packed, axis=1, count=n, bitorder='little').astype(bool)
+
     @staticmethod
     @lru_cache(maxsize=1000)
     def _nle_cached(h_tuple: tuple) -> int:
@@ -309,14 +631,14 @@ class BasicUtils:
         """
         Check if all observed orders are consistent with the partial order using vectorized operations.
         """
-        # Create a directed graph from the partial order matrix h
-        G_PO = nx.DiGraph(h)
         # Compute the transitive closure to capture all implied precedence relations
         tc_PO = BasicUtils.transitive_closure(h)
 
         # Convert observed orders to numpy arrays for vectorized operations
         for order in observed_orders:
-            positions = np.array([order.index(i) if i in order else float('inf') for i in range(h.shape[0])])
+            # Position of each item in the order (first occurrence), inf if absent
+            first_position = {item: idx for idx, item in reversed(list(enumerate(order)))}
+            positions = np.array([first_position.get(i, float('inf')) for i in range(h.shape[0])])
             # Check all edges in the transitive closure
             conflicts = tc_PO & (positions[:, np.newaxis] > positions[np.newaxis, :])
             if np.any(conflicts):
@@ -339,21 +661,16 @@ class BasicUtils:
         bool
             True if the matrix represents a valid partial order
         """
-        n = h.shape[0]
+        rel = np.asarray(h).astype(bool)
         
-        # Check antisymmetry
-        for i in range(n):
-            for j in range(i + 1, n):
-                if h[i, j] and h[j, i]:
-                    return False
+        # Check antisymmetry (off the diagonal)
+        if np.any(np.triu(rel & rel.T, k=1)):
+            return False
 
-        # Check transitivity
-        for i in range(n):
-            for j in range(n):
-                for k in range(n):
-                    if h[i, j] and h[j, k]:
-                        if not h[i, k]:
-                            return False
+        # Check transitivity: every two-step path i -> j -> k needs a direct edge i -> k
+        two_step = (rel.astype(np.int64) @ rel.astype(np.int64)) > 0
+        if np.any(two_step & ~rel):
+            return False
 
         return True
 
@@ -381,13 +698,8 @@ class BasicUtils:
         h_true_closed = BasicUtils.transitive_closure(h_true)
         h_final_closed = BasicUtils.transitive_closure(h_final)
         
-        missing = []
-        n = h_true.shape[0]
-        for i in range(n):
-            for j in range(n):
-                if h_true_closed[i, j] == 1 and h_final_closed[i, j] == 0:
-                    missing.append((index_to_item[i], index_to_item[j]))
-        return missing
+        mask = (h_true_closed == 1) & (h_final_closed == 0)
+        return [(index_to_item[i], index_to_item[j]) for i, j in np.argwhere(mask).tolist()]
 
     @staticmethod
     def compute_redundant_relationships(h_true: np.ndarray, h_final: np.ndarray, index_to_item: Dict[int, int]) -> List[tuple]:
@@ -413,10 +725,5 @@ class BasicUtils:
         h_true_closed = BasicUtils.transitive_closure(h_true)
         h_final_closed = BasicUtils.transitive_closure(h_final)
         
-        redundant = []
-        n = h_true.shape[0]
-        for i in range(n):
-            for j in range(n):
-                if h_true_closed[i, j] == 0 and h_final_closed[i, j] == 1:
-                    redundant.append((index_to_item[i], index_to_item[j]))
-        return redundant 
\ No newline at end of file
+        mask = (h_true_closed == 0) & (h_final_closed == 1)
+        return [(index_to_item[i], index_to_item[j]) for i, j in np.argwhere(mask).tolist()]
\ No newline at end of file
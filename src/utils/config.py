@@ -0,0 +1,67 @@
+"""
+Typed view of the MCMC configuration.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Any, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class McmcConfig:
+    """
+    The scalar settings read by the MCMC sampler, parsed once from the YAML config.
+
+    Attributes mirror the config keys they come from (see ``from_dict``).
+    """
+    num_iterations: int
+    K: int
+    burn_in: int
+    mcmc_pt: Tuple[float, float, float, float]
+    dr: float
+    drbeta: float
+    noise_option: str
+    sigma_mallow: float
+    rho_prior: float
+    noise_beta_prior: float
+    mallow_ua: float
+    sigma_beta: float
+    p: int
+    random_seed: Optional[int] = None
+
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> 'McmcConfig':
+        """
+        Build the configuration from a nested config dict (as returned by load_config).
+
+        Parameters:
+        -----------
+        config : Dict[str, Any]
+            MCMC configuration dictionary
+
+        Returns:
+        --------
+        McmcConfig
+            Parsed configuration; a missing key raises KeyError
+        """
+        update_probabilities = config['mcmc']['update_probabilities']
+        return cls(
+            num_iterations=int(config['mcmc']['num_iterations']),
+            K=int(config['generation']['K']),
+            burn_in=int(config['visualization']['burn_in']),
+            mcmc_pt=(
+                float(update_probabilities['rho']),
+                float(update_probabilities['noise']),
+                float(update_probabilities['U']),
+                float(update_probabilities['beta'])
+            ),
+            dr=float(config['rho']['dr']),
+            drbeta=float(config['beta']['drbeta']),
+            noise_option=config['noise']['noise_option'],
+            sigma_mallow=float(config['noise']['sigma_mallow']),
+            rho_prior=float(config['prior']['rho_prior']),
+            noise_beta_prior=float(config['prior']['noise_beta_prior']),
+            mallow_ua=float(config['prior']['mallow_ua']),
+            sigma_beta=float(config['prior']['sigma_beta']),
+            p=int(config.get('covariates', {}).get('p', 2)),
+            random_seed=config.get('random_seed')
+        )
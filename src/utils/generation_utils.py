@@ -100,7 +100,7 @@ class GenerationUtils:
         return h
 
     @staticmethod
-    def generate_U(n: int, K: int, rho_val: float) -> np.ndarray:
+    def generate_U(n: int, K: int, rho_val: float, rng: Optional[np.random.Generator] = None) -> np.ndarray:
         """
         Generate a latent variable matrix U of size n x K from a multivariate normal distribution
         with zero mean and a covariance matrix based on the given correlation rho_val.
@@ -109,6 +109,7 @@ class GenerationUtils:
         - n: Number of observations.
         - K: Number of features.
         - rho_val: Correlation value for constructing the covariance matrix.
+        - rng: Random generator to draw from (default: a fresh unseeded one).
 
         Returns:
         - U: An n x K numpy array of latent positions.
@@ -116,7 +117,9 @@ class GenerationUtils:
         K = int(K)
         cov = BasicUtils.build_Sigma_rho(K, rho_val)
         mean = np.zeros(K)
-        U = np.random.multivariate_normal(mean, cov, size=n)
+        if rng is None:
+            rng = np.random.default_rng()
+        U = rng.multivariate_normal(mean, cov, size=n)
         return U
 
     @staticmethod
@@ -225,7 +228,11 @@ class GenerationUtils:
         return ordering
 
     @staticmethod
-    def generate_subsets(N: int, n: int) -> List[List[int]]:
+    def generate_subsets(
+        N: int,
+        n: int,
+        rng: Optional[np.random.Generator] = None
+    ) -> List[List[int]]:
         """
         Generate N subsets O1, O2, ..., ON where:
         - N is the number of subsets.
@@ -235,25 +242,82 @@ class GenerationUtils:
         - Determining the subset size ni by uniformly sampling from [2, n].
         - Randomly selecting ni distinct elements from the set {0, 1, ..., n-1}.
 
+        All subsets are drawn at once: each row of an N x n matrix of
+        independent permutations is cut after its first ni entries.
+
         Parameters:
         - N: Number of subsets to generate.
         - n: Size of the universal set.
+        - rng: Random generator to draw from (default: a fresh unseeded one).
+
+        Returns:
+        - subsets: A list of subsets, each subset is a list of distinct sorted integers.
+        """
+        if rng is None:
+            rng = np.random.default_rng()
+
+        sizes = rng.integers(2, n + 1, size=N)
+        perms = rng.permuted(np.tile(np.arange(n), (N, 1)), axis=1)
+
+        # members[i, j] is True when item j is among the first sizes[i] entries of row i
+        members = np.zeros((N, n), dtype=bool)
+        rows = np.repeat(np.arange(N), n).reshape(N, n)
+        members[rows, perms] = np.arange(n) < sizes[:, None]
+
+        return [np.flatnonzero(row).tolist() for row in members]
+
+    @staticmethod
+    def sample_total_orders(
+        h: np.ndarray,
+        subsets: List[List[int]],
+        rng: Optional[np.random.Generator] = None
+    ) -> List[List[int]]:
+        """
+        Sample one total order (linear extension) per subset of a partial order.
+
+        Equivalent to calling `sample_total_order` on every subset: at each step a
+        minimal element among the remaining items is picked uniformly at random.
+        All subsets advance together, one position per step, so the work is a
+        handful of array operations per position instead of per subset.
+
+        Parameters:
+        - h: Transitive closure of the partial order (n x n, h[i, j]=1 => i < j).
+        - subsets: List of subsets (lists of node indices).
+        - rng: Random generator to draw from (default: a fresh unseeded one).
 
         Returns:
-        - subsets: A list of subsets, each subset is a list of distinct integers.
+        - total_orders: One sampled linear extension per subset.
         """
-        subsets = []
-        universal_set = list(range(n))  # Universal set from 0 to n-1
-
-        for _ in range(N):
-            # Randomly sample the subset size ni from [2, n]
-            ni = random.randint(2, n)
-            # Randomly select ni distinct elements from the universal set
-            subset = random.sample(universal_set, ni)
-            subset = sorted(subset)
-            subsets.append(subset)
-
-        return subsets
+        if rng is None:
+            rng = np.random.default_rng()
+
+        N = len(subsets)
+        if N == 0:
+            return []
+        n = h.shape[0]
+        tc = np.asarray(h, dtype=np.int64)
+        sizes = np.fromiter((len(s) for s in subsets), dtype=np.int64, count=N)
+
+        remaining = np.zeros((N, n), dtype=bool)
+        remaining[np.repeat(np.arange(N), sizes), np.concatenate(subsets).astype(np.int64)] = True
+
+        # indegree[i, j]: number of remaining predecessors of item j in subset i
+        indegree = remaining.astype(np.int64) @ tc
+        orders = np.empty((N, sizes.max()), dtype=np.int64)
+
+        for t in range(orders.shape[1]):
+            active = np.flatnonzero(sizes > t)
+            candidates = remaining[active] & (indegree[active] == 0)
+            if not candidates.any(axis=1).all():
+                raise ValueError("No minimal elements found. The partial order might contain cycles.")
+            # The argmax of i.i.d. uniforms over the candidates is a uniform pick
+            scores = np.where(candidates, rng.random(candidates.shape), -1.0)
+            picks = scores.argmax(axis=1)
+            orders[active, t] = picks
+            remaining[active, picks] = False
+            indegree[active] -= tc[picks]
+
+        return [orders[i, :sizes[i]].tolist() for i in range(N)]
 
     @staticmethod
     def generate_total_orders_for_assessor(
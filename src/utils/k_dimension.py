@@ -3,7 +3,6 @@ Utility functions for handling k-dimensional partial orders and their properties
 """
 
 import numpy as np
-import itertools
 from typing import List, Dict, Tuple, Any
 from .basic_utils import BasicUtils
 from .statistical_utils import StatisticalUtils
@@ -31,19 +30,24 @@ class KDimensionUtils:
             List of critical pairs (pairs of incomparable elements)
         """
         n = len(items)
-        critical_pairs = []
+        h = np.asarray(h)[:n, :n]
         
-        for i in range(n):
-            for j in range(i + 1, n):
-                if h[i, j] == 0 and h[j, i] == 0:
-                    critical_pairs.append((items[i], items[j]))
-                    
-        return critical_pairs
+        # Incomparable pairs above the diagonal, in row-major order
+        incomparable = np.triu((h == 0) & (h.T == 0), k=1)
+        return [(items[i], items[j]) for i, j in np.argwhere(incomparable).tolist()]
 
     @staticmethod
-    def find_min_realizer(h: np.ndarray, items: List[Any]) -> Tuple[List[List[Any]], int]:
+    def find_min_realizer(h: np.ndarray, items: List[Any], exact: bool = True) -> Tuple[List[List[Any]], int]:
         """
-        Find the minimal realizer of a partial order.
+        Find a minimal realizer of a partial order.
+        
+        A set of linear extensions realizes the partial order when, for every
+        incomparable pair (i, j), some extension puts i before j and some
+        extension puts j before i. Choosing the extensions is a set cover
+        problem over these ordered pairs, solved exactly as an integer program
+        with scipy.optimize.milp, or greedily when ``exact`` is False or milp
+        is unavailable (scipy < 1.9). The greedy cover is within a log factor
+        of the minimum.
         
         Parameters:
         -----------
@@ -51,30 +55,67 @@ class KDimensionUtils:
             Partial order matrix
         items : List[Any]
             List of items in the partial order
+        exact : bool, optional
+            Return a minimum realizer rather than the greedy approximation
         
         Returns:
         --------
         Tuple[List[List[Any]], int]
-            The minimal realizer and its size
+            The realizer and its size
         """
         all_exts = BasicUtils.generate_all_linear_extensions(h, items)
-        best_size = float('inf')
-        best_subset = None
-
-        # For each combination of linear extensions (starting from size 1)
-        for size in range(1, len(all_exts) + 1):
-            for combo in itertools.combinations(all_exts, size):
-                inter_matrix = KDimensionUtils.realizer_to_partial_order_matrix(combo, items)
-                # Convert inter_dict back to a matrix for comparison:
-                if np.array_equal(BasicUtils.transitive_closure(inter_matrix),
-                                BasicUtils.transitive_closure(h)):
-                    best_size = size
-                    best_subset = combo
-                    break
-            if best_subset is not None:
-                break
-    
-        return best_subset, best_size
+        closure = BasicUtils.transitive_closure(np.asarray(h)[:len(items), :len(items)])
+        # Incomparable pairs (i < j), as in find_critical_pairs
+        pair_idx = np.argwhere(np.triu((closure == 0) & (closure.T == 0), k=1))
+        if len(pair_idx) == 0:
+            # A total order is realized by its only linear extension
+            return [all_exts[0]], 1
+        
+        # covers[e, p] is True if extension e realizes ordered pair p: the
+        # first m columns are (i before j), the last m are (j before i)
+        item_index = {item: idx for idx, item in enumerate(items)}
+        pos = np.empty((len(all_exts), len(items)), dtype=np.int64)
+        for r, ext in enumerate(all_exts):
+            pos[r, [item_index[item] for item in ext]] = np.arange(len(ext))
+        forward = pos[:, pair_idx[:, 0]] < pos[:, pair_idx[:, 1]]
+        covers = np.concatenate([forward, ~forward], axis=1)
+        
+        if exact:
+            try:
+                from scipy.optimize import milp, LinearConstraint, Bounds
+            except ImportError:
+                exact = False
+        
+        if exact:
+            result = milp(c=np.ones(len(all_exts)),
+                          constraints=LinearConstraint(covers.T.astype(float), lb=1),
+                          integrality=np.ones(len(all_exts)),
+                          bounds=Bounds(0, 1))
+            if not result.success:
+                raise RuntimeError(f"Realizer integer program failed: {result.message}")
+            chosen = np.flatnonzero(result.x > 0.5).tolist()
+        else:
+            # Each extension's covered pairs as a Python int bitset
+            masks = [int.from_bytes(np.packbits(row, bitorder='little').tobytes(), 'little')
+                     for row in covers]
+            full = (1 << covers.shape[1]) - 1
+            uncovered = full
+            chosen = []
+            while uncovered:
+                best = max(range(len(masks)), key=lambda e: bin(masks[e] & uncovered).count('1'))
+                chosen.append(best)
+                uncovered &= ~masks[best]
+            # Drop extensions made redundant by later picks
+            for e in list(chosen):
+                rest = 0
+                for other in chosen:
+                    if other != e:
+                        rest |= masks[other]
+                if rest == full:
+                    chosen.remove(e)
+        
+        realizer = [all_exts[e] for e in chosen]
+        return realizer, len(realizer)
     
     @staticmethod
     def realizer_to_partial_order_matrix(realizer: List[List[Any]], items: List[Any] = None) -> np.ndarray:
@@ -98,13 +139,19 @@ class KDimensionUtils:
             items = sorted(set(item for ext in realizer for item in ext))
         item_index = {item: idx for idx, item in enumerate(items)}
         n = len(items)
-        H = np.zeros((n, n), dtype=int)
         
-        # For each pair (i,j) check if every extension orders items[i] before items[j]
-        for i in range(n):
-            for j in range(n):
-                if i != j:
-                    H[i, j] = 1 if all(ext.index(items[i]) < ext.index(items[j]) for ext in realizer) else 0
+        # pos[r, i] is the position of items[i] in the r-th linear extension
+        pos = np.full((len(realizer), n), -1, dtype=np.int64)
+        for r, ext in enumerate(realizer):
+            for position, item in enumerate(ext):
+                if item in item_index:
+                    pos[r, item_index[item]] = position
+        if np.any(pos < 0):
+            raise ValueError("Every linear extension must contain all items")
+        
+        # H[i, j] = 1 if every extension orders items[i] before items[j]
+        H = np.all(pos[:, :, None] < pos[:, None, :], axis=0).astype(int)
+        np.fill_diagonal(H, 0)
 
         return H
 
@@ -130,23 +177,13 @@ class KDimensionUtils:
         B = [f"b{i}" for i in range(1, k+1)]
         items = A + B
         
-        # Build adjacency dictionary
-        adj = {x: set() for x in items}
-        for i, a_item in enumerate(A, start=1):
-            for j, b_item in enumerate(B, start=1):
-                if i != j:
-                    adj[a_item].add(b_item)
-        
-        # Build a mapping from item to its index
-        item_to_index = {item: idx for idx, item in enumerate(items)}
-        
-        # Create adjacency matrix
+        # a_i < b_j for every i != j: the A -> B block is ones minus the identity
         n = len(items)
         adj_matrix = np.zeros((n, n), dtype=int)
-        for x, neighbors in adj.items():
-            for y in neighbors:
-                i = item_to_index[x]
-                j = item_to_index[y]
-                adj_matrix[i, j] = 1
+        adj_matrix[:k, k:] = 1 - np.eye(k, dtype=int)
+        
+        adj = {x: set() for x in items}
+        for i, j in np.argwhere(adj_matrix).tolist():
+            adj[items[i]].add(items[j])
                 
         return items, adj, adj_matrix
\ No newline at end of file
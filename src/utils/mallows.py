@@ -37,11 +37,12 @@ class Mallows:
 
         # Count how many items in `y` are positioned before `i` in `y` 
         # even though `i` has a smaller index in `y`.
-        idx_i = y.index(i)
+        position = {a: idx for idx, a in reversed(list(enumerate(y)))}
+        idx_i = position[i]
         d = 0
         for a in y:
             if a != i:
-                if idx_i > y.index(a):
+                if idx_i > position[a]:
                     d += 1
 
         # The denominator is sum_{k=0..(|y|-1)} e^{-theta * k}, for length(y) items
@@ -241,7 +241,7 @@ class StatisticalUtils:
 
 #   ### rho 
     @staticmethod
-    def rRprior(fac=1/6, tol=1e-4):
+    def rRprior(fac=1/6, tol=1e-4, rng=None):
         """
         Draw a sample for ρ from a Beta(1, fac) distribution, but reject any sample
         for which 1 - ρ < tol, to avoid numerical instability when ρ is extremely close to 1.
@@ -249,12 +249,13 @@ class StatisticalUtils:
         Parameters:
         fac: Second parameter of the Beta distribution (default 1/6).
         tol: Tolerance such that we require 1 - ρ >= tol (default 1e-4).
+        rng: Random generator to draw from (default: numpy's global state).
         
         Returns:
         A single float value for ρ.
         """
         while True:
-            rho = beta.rvs(1, fac)
+            rho = beta.rvs(1, fac, random_state=rng)
             if 1 - rho >= tol:
                 return rho
     @staticmethod
@@ -282,8 +283,8 @@ class StatisticalUtils:
 ####Prob 
 
     @staticmethod
-    def rPprior(noise_beta_prior):
-        return beta.rvs(1, noise_beta_prior)
+    def rPprior(noise_beta_prior, rng=None):
+        return beta.rvs(1, noise_beta_prior, random_state=rng)
     
     @staticmethod
     def dPprior(p, beta_param):
@@ -311,8 +312,8 @@ class StatisticalUtils:
 ####Theta  
 
     @staticmethod
-    def rTprior(mallow_ua):
-        return gamma.rvs(a=1, scale=1.0/mallow_ua)
+    def rTprior(mallow_ua, rng=None):
+        return gamma.rvs(a=1, scale=1.0/mallow_ua, random_state=rng)
     @staticmethod
     def dTprior(mallow_theta, ua):
         """
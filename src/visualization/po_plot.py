@@ -15,6 +15,13 @@ from scipy.stats import beta, expon, kstest, probplot
 from matplotlib.backends.backend_pdf import PdfPages
 from pathlib import Path
 
+
+def _show() -> None:
+    """Display open figures, unless a file-only backend such as Agg is active."""
+    if plt.get_backend().lower() not in ('agg', 'pdf', 'ps', 'svg', 'cairo', 'template'):
+        plt.show()
+
+
 class POPlot:
     """Class for visualizing partial orders and MCMC results."""
     
@@ -140,7 +147,7 @@ class POPlot:
         axes[-1].set_xlabel('Iteration')
         plt.suptitle(f'Trace Plot of Multidimensional Latent Variables Z (Post Burn-in)', fontsize=16)
         plt.tight_layout(rect=[0, 0.03, 1, 0.95])
-        plt.show()
+        _show()
 
     @staticmethod
     def plot_acceptance_rates(accepted_iterations: List[int], acceptance_rates: List[float]) -> None:
@@ -152,7 +159,7 @@ class POPlot:
         plt.title('Acceptance Rate Over Time', fontsize=14)
         plt.grid(True)
         plt.tight_layout()
-        plt.show()
+        _show()
 
     @staticmethod
     def plot_top_partial_orders(top_percentages: List[Tuple[np.ndarray, int, float]], 
@@ -180,7 +187,7 @@ class POPlot:
                 plt.axis('off')
         
         plt.tight_layout()
-        plt.show()
+        _show()
 
     @staticmethod
     def plot_log_likelihood(log_likelihood_data: Union[Dict[str, Any], List[float]], 
@@ -213,13 +220,14 @@ class POPlot:
         
         plt.legend(title='State')
         plt.tight_layout()
-        plt.show()
+        _show()
     
     @staticmethod
     def visualize_partial_order(
         final_h: np.ndarray,
         Ma_list: list,
-        title: str = None
+        title: str = None,
+        ax=None
     ) -> None:
         """
         Visualizes the partial order for a single assessor using NetworkX and PyGraphviz for layout.
@@ -229,10 +237,16 @@ class POPlot:
         - Ma_list (list): A list of item labels corresponding to the nodes in the partial order.
         - assessor (int, optional): The assessor ID. If provided and title is not specified, it will be used in the default title.
         - title (str, optional): The title of the plot. If not provided, a default title is generated.
+        - ax (matplotlib.axes.Axes, optional): Axes to draw on. Defaults to the current axes; when given,
+          the figure is left to the caller instead of being shown.
         """
         import networkx as nx
         import matplotlib.pyplot as plt
         
+        show = ax is None
+        if ax is None:
+            ax = plt.gca()
+        
         # Set default title if not provided.
         if title is None:
             if assessor is not None:
@@ -260,15 +274,15 @@ class POPlot:
             A.layout('dot')
             A.draw('graph.png')
             img = plt.imread('graph.png')
-            plt.imshow(img)
-            plt.axis('off')
-            plt.title(title)
-            plt.show()
+            ax.imshow(img)
+            ax.axis('off')
+            ax.set_title(title)
         except (ImportError, nx.NetworkXException):
             pos = nx.spring_layout(G)
-            nx.draw(G, pos, labels=labels, with_labels=True, arrows=True)
-            plt.title(title)
-            plt.show()
+            nx.draw(G, pos, ax=ax, labels=labels, with_labels=True, arrows=True)
+            ax.set_title(title)
+        if show:
+            _show()
 
     @staticmethod
     def plot_mcmc_inferred_variables(mcmc_results: Dict[str, Any],
@@ -395,7 +409,7 @@ class POPlot:
         plt.tight_layout()
         plt.savefig(os.path.join(output_filepath, output_filename))
         print(f"[INFO] Saved MCMC parameter plots to '{output_filename}'")
-        plt.show()
+        _show()
 
     @staticmethod
     def create_mcmc_trace_plot(
@@ -538,4 +552,4 @@ class POPlot:
             outname = os.path.join(output_filepath, f"beta_{d}_plot.pdf")
             plt.savefig(outname, dpi=300, bbox_inches='tight')
             print(f"[INFO] Saved beta coefficient {d} plot to '{outname}'")
-            plt.show()
\ No newline at end of file
+            _show()
\ No newline at end of file
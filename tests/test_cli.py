@@ -0,0 +1,34 @@
+"""
+Test module for the command-line interface.
+"""
+
+import sys
+import subprocess
+from pathlib import Path
+from src.cli import main
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+def test_cli_import_is_lightweight():
+    """Test that importing the CLI does not pull in yaml or the scientific stack."""
+    code = (
+        "import sys, src.cli; "
+        "print(','.join(m for m in ('yaml', 'numpy', 'scipy', 'matplotlib') if m in sys.modules))"
+    )
+    result = subprocess.run([sys.executable, '-c', code], cwd=PROJECT_ROOT,
+                            capture_output=True, text=True, check=True)
+    assert result.stdout.strip() == ''
+
+def test_cli_version(capsys):
+    """Test that --version prints the package version and exits cleanly."""
+    from src import __version__
+    assert main(['--version']) == 0
+    assert capsys.readouterr().out.strip() == f"po_inference {__version__}"
+
+def test_cli_failure_exit_status(tmp_path):
+    """Test that a failing run exits non-zero from every script entry point."""
+    missing = str(tmp_path / 'missing.yaml')
+    for script in ('main.py', 'scripts/run_po_inference.py'):
+        result = subprocess.run([sys.executable, script, '--mcmc-config', missing],
+                                cwd=PROJECT_ROOT, capture_output=True, text=True)
+        assert result.returncode != 0, script
@@ -0,0 +1,81 @@
+"""
+Test module for configuration loading.
+"""
+
+import os
+import shutil
+import pytest
+from pathlib import Path
+from src.utils.basic_utils import load_config, compile_configs
+from src.utils.config import McmcConfig
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Create a small YAML configuration file."""
+    path = tmp_path / "config.yaml"
+    path.write_text("mcmc:\n  num_iterations: 100\n  K: 3\n")
+    return path
+
+def test_load_config_returns_copy(config_file):
+    """Test that cached configs can be mutated without affecting later loads."""
+    config = load_config(str(config_file))
+    config['mcmc']['K'] = 10
+    assert load_config(str(config_file))['mcmc']['K'] == 3
+
+def test_load_config_detects_changes(config_file):
+    """Test that the cache is invalidated when the file changes."""
+    assert load_config(str(config_file))['mcmc']['num_iterations'] == 100
+    config_file.write_text("mcmc:\n  num_iterations: 2500\n  K: 3\n")
+    st = os.stat(config_file)
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_config(str(config_file))['mcmc']['num_iterations'] == 2500
+
+def test_load_config_writes_json_sidecar(config_file):
+    """Test that a JSON copy of the config is written and reused."""
+    config = load_config(str(config_file))
+    sidecar = str(config_file) + '.json'
+    assert os.path.exists(sidecar)
+    load_config.cache_clear()
+    assert load_config(str(config_file)) == config
+
+def test_load_config_sidecar_tracks_source_stamp(config_file):
+    """Test that a JSON copy is ignored once the YAML's (mtime, size) no longer match."""
+    assert load_config(str(config_file))['mcmc']['num_iterations'] == 100
+    st = os.stat(config_file)
+    # Rewrite within the same timestamp tick, then restore an older copy
+    config_file.write_text("mcmc:\n  num_iterations: 999999\n  K: 3\n")
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+    load_config.cache_clear()
+    assert load_config(str(config_file))['mcmc']['num_iterations'] == 999999
+    config_file.write_text("mcmc:\n  num_iterations: 100\n  K: 3\n")
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns - 10_000_000_000))
+    load_config.cache_clear()
+    assert load_config(str(config_file))['mcmc']['num_iterations'] == 100
+
+def test_load_config_cache_clear_forces_reparse(config_file):
+    """Test that cache_clear picks up a same-size rewrite within one timestamp tick."""
+    assert load_config(str(config_file))['mcmc']['num_iterations'] == 100
+    st = os.stat(config_file)
+    config_file.write_text("mcmc:\n  num_iterations: 200\n  K: 3\n")
+    os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+    load_config.cache_clear()
+    assert load_config(str(config_file))['mcmc']['num_iterations'] == 200
+
+def test_compile_configs(config_file):
+    """Test that compile_configs writes a JSON copy that load_config reads back."""
+    written = compile_configs(str(config_file.parent))
+    assert written == [os.path.abspath(str(config_file) + '.json')]
+    load_config.cache_clear()
+    assert load_config(str(config_file)) == {'mcmc': {'num_iterations': 100, 'K': 3}}
+
+def test_mcmc_config_from_dict(tmp_path):
+    """Test that the bundled MCMC config parses into a frozen McmcConfig."""
+    # Work on a copy so the JSON cache is not written into the source tree
+    bundled = Path(__file__).resolve().parent.parent / 'config' / 'mcmc_config.yaml'
+    path = tmp_path / 'mcmc_config.yaml'
+    shutil.copyfile(bundled, path)
+    config = McmcConfig.from_dict(load_config(str(path)))
+    assert config.K == 3
+    assert len(config.mcmc_pt) == 4
+    with pytest.raises(AttributeError):
+        config.K = 4
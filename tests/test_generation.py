@@ -0,0 +1,23 @@
+"""
+Test module for synthetic data generation.
+"""
+
+import numpy as np
+from src.utils.basic_utils import BasicUtils
+from src.utils.generation_utils import GenerationUtils
+
+def test_sample_total_orders_are_linear_extensions():
+    """Test that batched sampling returns a linear extension of every subset."""
+    rng = np.random.default_rng(0)
+    h = BasicUtils.generate_partial_order(rng.standard_normal((8, 2)))
+    tc = BasicUtils.transitive_closure(h)
+    subsets = GenerationUtils.generate_subsets(200, 8, rng=rng)
+    orders = GenerationUtils.sample_total_orders(tc, subsets, rng=rng)
+
+    assert len(orders) == len(subsets)
+    for subset, order in zip(subsets, orders):
+        assert 2 <= len(subset) <= 8
+        assert sorted(order) == subset
+        for i, a in enumerate(order):
+            for b in order[:i]:
+                assert tc[a, b] == 0
@@ -0,0 +1,108 @@
+"""
+Test module for inference data and results I/O.
+"""
+
+import os
+import numpy as np
+import pytest
+import src.inference.po_inference as po_inference
+from src.inference.po_inference import save_data, load_data, run_inference
+from src.inference.po_inference import save_results, load_results, TRACE_KEYS
+from src.inference.po_inference import _combine_chains, _post_burn_in_ranges, _streaming_nanmean
+
+def _observation_data():
+    """Small dataset with ragged observations."""
+    return {
+        'items': {'names': ['a', 'b', 'c', 'd']},
+        'total_orders': [[0, 2, 1], [3, 1], [2, 0, 3, 1]],
+        'subsets': [[0, 1, 2], [1, 3], [0, 1, 2, 3]],
+    }
+
+def test_save_load_data_json_round_trip(tmp_path):
+    """Test that small datasets are stored as plain JSON and read back unchanged."""
+    path = str(tmp_path / 'data.json')
+    save_data(_observation_data(), path)
+    assert sorted(os.listdir(tmp_path)) == ['data.json']
+    assert load_data(path) == _observation_data()
+
+def test_save_load_data_npy_round_trip(tmp_path, monkeypatch):
+    """Test that datasets above the threshold use .npy observations and read back unchanged."""
+    monkeypatch.setattr(po_inference, 'OBSERVATIONS_NPY_THRESHOLD', 5)
+    path = str(tmp_path / 'data.json')
+    save_data(_observation_data(), path)
+    assert sorted(os.listdir(tmp_path)) == ['data.json', 'data_observations.npy', 'data_offsets.npy']
+    assert load_data(path) == _observation_data()
+
+def _chain(length, offset):
+    """Fake single-chain result whose h_trace samples are numbered from offset."""
+    h_trace = np.arange(offset, offset + length, dtype=np.int8)[:, None, None] * np.ones((1, 2, 2), dtype=np.int8)
+    return {
+        'h_trace': h_trace,
+        'rho_trace': [float(offset + t) for t in range(length)],
+        'index_to_item': {0: 'a', 1: 'b'},
+        'overall_acceptance_rate': 0.1 * (offset + 1),
+    }
+
+def test_combine_chains_concatenates_traces():
+    """Test that traces are concatenated in chain order and chain lengths are recorded."""
+    combined = _combine_chains([_chain(3, 0), _chain(4, 10)])
+    assert combined['chain_lengths'] == [3, 4]
+    assert combined['num_chains'] == 2
+    assert combined['h_trace'][:, 0, 0].tolist() == [0, 1, 2, 10, 11, 12, 13]
+    assert combined['rho_trace'] == [0.0, 1.0, 2.0, 10.0, 11.0, 12.0, 13.0]
+    assert combined['index_to_item'] == {0: 'a', 1: 'b'}
+    assert combined['overall_acceptance_rate'] == pytest.approx(0.6)
+
+def test_post_burn_in_ranges_per_chain():
+    """Test that burn-in is dropped from the start of every chain, not just the first."""
+    combined = _combine_chains([_chain(3, 0), _chain(4, 10)])
+    ranges = _post_burn_in_ranges(combined['chain_lengths'], burn_in=1)
+    kept = [int(combined['h_trace'][i, 0, 0]) for indices in ranges for i in indices]
+    assert kept == [1, 2, 11, 12, 13]
+
+@pytest.mark.parametrize('kwargs', [{'num_chains': 0}, {'num_chains': 2, 'num_workers': 0}])
+def test_run_inference_rejects_non_positive_counts(kwargs):
+    """Test that chain and worker counts below 1 are rejected up front."""
+    with pytest.raises(ValueError):
+        run_inference({}, {}, **kwargs)
+
+def test_save_load_results_round_trip(tmp_path):
+    """Test that results come back with the same keys, arrays and dtypes, and a rebuilt trace."""
+    rng = np.random.default_rng(0)
+    results = {
+        'Z_trace': [rng.standard_normal((3, 2)) for _ in range(4)],
+        'h_trace': rng.integers(0, 2, size=(4, 3, 3)).astype(np.int8),
+        'rho_trace': [0.1, 0.2, 0.3, 0.4],
+        'h': np.array([[0, 1, 0], [0, 0, 0], [0, 0, 0]]),
+        'overall_acceptance_rate': 0.25,
+        'index_to_item': {'0': 'a', '1': 'b', '2': 'c'},
+        'chain_lengths': [4],
+    }
+    results['trace'] = {key: results.get(key, []) for key in TRACE_KEYS}
+    save_results(results, str(tmp_path), 'run')
+    assert np.array_equal(np.load(tmp_path / 'run_partial_order.npy'), results['h'])
+
+    loaded = load_results(str(tmp_path), 'run')
+    assert set(loaded) == set(results)
+    for key in ('Z_trace', 'h_trace', 'rho_trace', 'h', 'chain_lengths'):
+        expected = np.asarray(results[key])
+        assert np.array_equal(loaded[key], expected)
+        assert loaded[key].dtype == expected.dtype
+    assert loaded['overall_acceptance_rate'] == 0.25
+    assert loaded['index_to_item'] == results['index_to_item']
+    assert set(loaded['trace']) == set(TRACE_KEYS)
+    assert loaded['trace']['h_trace'] is loaded['h_trace']
+
+def test_streaming_nanmean_matches_nanmean():
+    """Test the single-pass mean against np.nanmean over multi-chain post-burn-in samples."""
+    rng = np.random.default_rng(3)
+    trace = rng.random((9, 4, 4))
+    trace[rng.random(trace.shape) < 0.2] = np.nan
+    trace[:, 0, 0] = np.nan  # an entry that is NaN in every sample
+    ranges = _post_burn_in_ranges([4, 5], burn_in=2)
+    indices = [i for r in ranges for i in r]
+    with pytest.warns(RuntimeWarning):  # mean of the all-NaN entry
+        expected = np.nanmean(np.stack([trace[i] for i in indices]), axis=0)
+    result = _streaming_nanmean(trace[i] for i in indices)
+    assert np.allclose(result, expected, equal_nan=True)
+    assert np.isnan(result[0, 0])
@@ -0,0 +1,56 @@
+"""
+Test module for partial order utilities.
+"""
+
+import numpy as np
+import src.utils.basic_utils as basic_utils
+from src.utils.basic_utils import BasicUtils
+
+def test_generate_partial_order_dominance():
+    """Test that i < j exactly when eta[i] dominates eta[j]."""
+    eta = np.array([[2.0, 2.0], [1.0, 2.0], [0.0, 3.0], [2.0, 2.0]])
+    h = BasicUtils.generate_partial_order(eta)
+    expected = np.array([
+        [0, 1, 0, 0],
+        [0, 0, 0, 0],
+        [0, 0, 0, 0],
+        [0, 1, 0, 0],
+    ])
+    assert np.array_equal(h, expected)
+    assert BasicUtils.is_valid_partial_order(h)
+
+def test_generate_partial_order_kernel_matches_broadcasting(monkeypatch):
+    """Test that the large-n code path gives the same matrix as broadcasting."""
+    eta = np.random.default_rng(0).standard_normal((40, 3))
+    expected = BasicUtils.generate_partial_order(eta)
+    monkeypatch.setattr(basic_utils, 'PARTIAL_ORDER_JIT_THRESHOLD', 10)
+    assert np.array_equal(BasicUtils.generate_partial_order(eta), expected)
+
+def test_transitive_closure_bitset_matches_reachability():
+    """Test the bit-packed closure across the 64-bit word boundary."""
+    rng = np.random.default_rng(1)
+    for n in (1, 5, 64, 70):
+        h = (rng.random((n, n)) < 0.05).astype(int)
+        reach = h.astype(bool)
+        for _ in range(n):
+            reach = reach | ((reach.astype(int) @ h) > 0)
+        assert np.array_equal(BasicUtils.transitive_closure_bitset(h), reach)
+        assert np.array_equal(BasicUtils.transitive_closure(h), reach.astype(int))
+
+def test_find_min_realizer_crown():
+    """Test that the crown poset on 2k items has dimension k."""
+    from src.utils.k_dimension import KDimensionUtils
+    items, _, h = KDimensionUtils.generate_crown_poset(3)
+    for exact in (True, False):
+        realizer, size = KDimensionUtils.find_min_realizer(h, items, exact=exact)
+        assert size == len(realizer) == 3
+        inter = KDimensionUtils.realizer_to_partial_order_matrix(realizer, items)
+        assert np.array_equal(inter, BasicUtils.transitive_closure(h))
+
+def test_transitive_reduction_batch_matches_single():
+    """Test that the batched reduction reduces each matrix independently."""
+    rng = np.random.default_rng(2)
+    hs = np.stack([BasicUtils.generate_partial_order(rng.standard_normal((12, 2))) for _ in range(4)])
+    reduced = BasicUtils.transitive_reduction_batch(hs)
+    for h, tr in zip(hs, reduced):
+        assert np.array_equal(tr, BasicUtils.transitive_reduction(h))